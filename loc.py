@@ -1,4 +1,5 @@
 import httpx
+import orjson
 import re
 from typing import Optional, List, Dict, Any
 from loguru import logger
@@ -17,6 +18,14 @@ HEADERS = {
     "Accept": "application/json"
 }
 
+# Pooled client reused across calls so concurrent LoC lookups share keep-alive connections.
+# Closed by main.py on application shutdown.
+http_client = httpx.AsyncClient(
+    headers=HEADERS,
+    timeout=10.0,
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+)
+
 async def get_loc_data_by_isbn(isbn: str) -> Dict[str, Any]:
     """
     Fetches bibliographic data from the Library of Congress API using ISBN.
@@ -28,20 +37,19 @@ async def get_loc_data_by_isbn(isbn: str) -> Dict[str, Any]:
     }
     
     try:
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(LOC_BOOK_API_BASE, params=params, headers=HEADERS, timeout=10.0)
-            if resp.status_code == 404:
-                return {}
-            resp.raise_for_status()
-            data = resp.json()
-            
-            results = data.get("results", [])
-            if not results:
-                return {}
-            
-            # Use the first result (most relevant)
-            item = results[0]
-            return _normalize_loc_item(item)
+        resp = await http_client.get(LOC_BOOK_API_BASE, params=params)
+        if resp.status_code == 404:
+            return {}
+        resp.raise_for_status()
+        data = orjson.loads(resp.content)
+        
+        results = data.get("results", [])
+        if not results:
+            return {}
+        
+        # Use the first result (most relevant)
+        item = results[0]
+        return _normalize_loc_item(item)
             
     except Exception as e:
         logger.warning(f"LoC API error for ISBN {isbn}: {e}")
@@ -60,25 +68,24 @@ async def get_loc_data_by_lccn(lccn: str) -> Dict[str, Any]:
     params = {"fo": "json"}
     
     try:
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(url, params=params, headers=HEADERS, timeout=10.0)
-            
-            # If the ID doesn't exist, LOC returns 404
-            if resp.status_code == 404:
-                logger.info(f"LOC: Item {clean_lccn} not found (404).")
-                return {}
-                
-            resp.raise_for_status()
-            data = resp.json()
-            
-            # The Item Endpoint structure is different. 
-            # The data is inside "item" dict, not a "results" list.
-            item_data = data.get("item", {})
-            if not item_data:
-                logger.warning(f"LOC: Item {clean_lccn} returned valid JSON but no 'item' field.")
-                return {}
+        resp = await http_client.get(url, params=params)
+        
+        # If the ID doesn't exist, LOC returns 404
+        if resp.status_code == 404:
+            logger.info(f"LOC: Item {clean_lccn} not found (404).")
+            return {}
             
-            return _normalize_loc_item(item_data)
+        resp.raise_for_status()
+        data = orjson.loads(resp.content)
+        
+        # The Item Endpoint structure is different. 
+        # The data is inside "item" dict, not a "results" list.
+        item_data = data.get("item", {})
+        if not item_data:
+            logger.warning(f"LOC: Item {clean_lccn} returned valid JSON but no 'item' field.")
+            return {}
+        
+        return _normalize_loc_item(item_data)
             
     except Exception as e:
         logger.error(f"Error fetching LOC Item {lccn}: {e}")
@@ -98,27 +105,26 @@ async def search_loc(query: str, limit: int = 10) -> List[Dict[str, Any]]:
     }
 
     try:
-        async with httpx.AsyncClient() as client:
-            # We use the General Search endpoint here, not just /books
-            resp = await client.get(LOC_SEARCH_API_BASE, params=params, headers=HEADERS, timeout=10.0)
-            if resp.status_code != 200:
-                return []
-            
-            data = resp.json()
-            results = data.get("results", [])
-            
-            normalized_results = []
-            for item in results:
-                # We skip items that are just web pages about the library
-                if "web page" in item.get("original_format", []):
-                    continue
-                    
-                normalized = _normalize_loc_item(item)
-                # Mark as a "Primary Source" so the frontend can show a special badge
-                normalized["is_primary_source"] = True 
-                normalized_results.append(normalized)
+        # We use the General Search endpoint here, not just /books
+        resp = await http_client.get(LOC_SEARCH_API_BASE, params=params)
+        if resp.status_code != 200:
+            return []
+        
+        data = orjson.loads(resp.content)
+        results = data.get("results", [])
+        
+        normalized_results = []
+        for item in results:
+            # We skip items that are just web pages about the library
+            if "web page" in item.get("original_format", []):
+                continue
                 
-            return normalized_results
+            normalized = _normalize_loc_item(item)
+            # Mark as a "Primary Source" so the frontend can show a special badge
+            normalized["is_primary_source"] = True 
+            normalized_results.append(normalized)
+            
+        return normalized_results
 
     except Exception as e:
         logger.error(f"LoC Search error: {e}")
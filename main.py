@@ -2,20 +2,25 @@
 import os
 import httpx
 import asyncio
-import json
+import orjson
 import hashlib
+import heapq
+import html
 import sys
 import re
+import time
+from calendar import monthrange
 from datetime import datetime, timedelta 
+from functools import lru_cache, wraps
+from itertools import chain
+from operator import mul
 from pathlib import Path
 from fastapi import FastAPI, Query, HTTPException, Request, Depends, Path as FastAPIPath, Header, Response, status
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field, ValidationError
 from dotenv import load_dotenv
 from typing import List, Optional, Dict, Any
-from redis.asyncio import Redis
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.util import get_remote_address
-from slowapi.errors import RateLimitExceeded
+from redis.asyncio import Redis, BlockingConnectionPool
 from loguru import logger
 import fiction
 import non_fiction
@@ -50,17 +55,77 @@ def get_real_ip(request: Request):
     # Fallback to direct connection IP (for local testing)
     return request.client.host or "127.0.0.1"
 
+# --- SECURITY UPGRADE: Async Fixed-Window Rate Limiter ---
+# One MULTI/EXEC round-trip (INCR + EXPIRE) per request on the shared async Redis client,
+# keyed by endpoint + client IP + window number. Replaces slowapi, whose Redis storage ran
+# on a separate synchronous client and blocked the event loop on every limited request.
+RATE_LIMIT_WINDOWS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+class RateLimitExceeded(Exception):
+    def __init__(self, detail: str, retry_after: int):
+        self.detail = detail
+        self.retry_after = retry_after
+
+class RateLimiter:
+    def __init__(self, key_func):
+        self.key_func = key_func
+
+    def limit(self, rate: str):
+        count, _, unit = rate.partition("/")
+        unit = unit.strip()
+        max_hits, window = int(count), RATE_LIMIT_WINDOWS[unit]
+        # Same wording slowapi used in its 429 body, e.g. "20 per 1 minute"
+        description = f"{max_hits} per 1 {unit}"
+
+        def decorator(func):
+            scope = func.__name__
+
+            @wraps(func)
+            async def wrapper(*args, **kwargs):
+                request = kwargs.get("request")
+                if request is not None:
+                    await self._hit(request, scope, description, max_hits, window)
+                return await func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    async def _hit(self, request: Request, scope: str, description: str, max_hits: int, window: int) -> None:
+        if not cache: return
+        window_id, elapsed = divmod(int(time.time()), window)
+        bucket = f"rl:{scope}:{self.key_func(request)}:{window_id}"
+        try:
+            pipe = cache.pipeline(transaction=True)
+            pipe.incr(bucket)
+            pipe.expire(bucket, window)
+            hits, _ = await pipe.execute()
+        except Exception as e:
+            # Fail open: a Redis blip should not take the API down with it
+            logger.warning(f"Rate limiter Redis error: {e}")
+            return
+        if hits > max_hits:
+            raise RateLimitExceeded(description, window - elapsed)
+
 # Initialize Limiter with the new Smart IP detector
-limiter = Limiter(key_func=get_real_ip, storage_uri=REDIS_URL, default_limits=["100/minute"])
+limiter = RateLimiter(key_func=get_real_ip)
 
 app = FastAPI(
     title="Bookfinder Intelligent API",
     description="A robust, heuristic-driven book API with automated tagging, series detection, and deep mining.",
-    version="5.1.0" 
+    version="5.1.0",
+    # orjson renders responses ~5x faster than the stdlib json encoder
+    default_response_class=ORJSONResponse
 )
 
-app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+# Keeps the 429 body slowapi's default handler sent ({"error": "Rate limit exceeded: ..."}),
+# so existing clients parsing it are unaffected
+@app.exception_handler(RateLimitExceeded)
+async def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded):
+    return ORJSONResponse(
+        {"error": f"Rate limit exceeded: {exc.detail}"},
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
 
 # --- SECURITY UPGRADE: The "Bouncer" Middleware ---
 # Blocks bad bots BEFORE they touch any logic or database
@@ -83,7 +148,7 @@ async def block_bad_bots(request: Request, call_next):
     if any(bot in user_agent for bot in bad_bots):
         logger.warning(f"BLOCKED BOT: {user_agent} from {get_real_ip(request)}")
         return Response(
-            content=json.dumps({"detail": "Bot access denied. Please respect robots.txt."}), 
+            content=orjson.dumps({"detail": "Bot access denied. Please respect robots.txt."}), 
             status_code=status.HTTP_403_FORBIDDEN,
             media_type="application/json"
         )
@@ -97,8 +162,32 @@ GOOGLE_BOOKS_API_URL = "https://www.googleapis.com/books/v1/volumes"
 OPEN_LIBRARY_API_URL = "https://openlibrary.org"
 WIKIDATA_SPARQL_URL = "https://query.wikidata.org/sparql"
 
+# --- UPSTREAM FIELD MASKS ---
+# Partial-response masks, built once instead of per call
+GOOGLE_ISBN_FIELDS = "totalItems,items(id,volumeInfo(title,subtitle,authors,publisher,publishedDate,description,pageCount,averageRating,ratingsCount,categories,dimensions,imageLinks(thumbnail,smallThumbnail,small,medium,large,extraLarge),industryIdentifiers,language),saleInfo,accessInfo)"
+GOOGLE_SEARCH_FIELDS = "items(id,volumeInfo(title,subtitle,authors,publisher,publishedDate,averageRating,ratingsCount,categories,imageLinks(thumbnail,small),industryIdentifiers,description,pageCount))"
+GOOGLE_HEALTH_PARAMS = {"q": "a", "maxResults": 1, "fields": "totalItems", "key": API_KEY}
+OL_SEARCH_FIELDS = "title,subtitle,author_name,author_key,isbn,key,publisher,subject,first_publish_year,cover_i"
+
+# --- UPSTREAM CONCURRENCY CAPS ---
+# Per-worker caps on in-flight network calls to each provider (cache hits are never gated).
+# Fan-out paths (cover rescues, author lookups) can fire dozens of calls at once;
+# this keeps them from triggering a 429 storm from Google / Open Library.
+# Overridable per deployment so the Google cap can track the API key's quota.
+GOOGLE_MAX_CONCURRENCY = int(os.getenv("GOOGLE_MAX_CONCURRENCY", "10"))
+OL_MAX_CONCURRENCY = int(os.getenv("OL_MAX_CONCURRENCY", "20"))
+GOOGLE_SEM = asyncio.Semaphore(GOOGLE_MAX_CONCURRENCY)
+OL_SEM = asyncio.Semaphore(OL_MAX_CONCURRENCY)
+
+def _upstream_semaphore(url: str) -> Optional[asyncio.Semaphore]:
+    if url.startswith(GOOGLE_BOOKS_API_URL): return GOOGLE_SEM
+    if url.startswith(OPEN_LIBRARY_API_URL): return OL_SEM
+    return None
+
 # --- DATA HYGIENE: The Blacklist ---
-TITLE_BLACKLIST = [
+# Entries are lowercase and match anywhere in the title ("The Hobbit: Deluxe Edition"),
+# so membership is one compiled alternation search rather than a scan per entry.
+TITLE_BLACKLIST = frozenset({
     "cloud mountain",
     "the great gatsby",
     "1984",
@@ -108,52 +197,212 @@ TITLE_BLACKLIST = [
     "little women",
     "me before you", 
     "the dead zone"
-]
+})
+TITLE_BLACKLIST_RE = re.compile("|".join(map(re.escape, TITLE_BLACKLIST)))
+
+def _is_blacklisted(lower_title: str) -> bool:
+    return TITLE_BLACKLIST_RE.search(lower_title) is not None
+
+# Explicit per-worker pool: a blocking pool makes a burst (e.g. /new-releases rescue fan-out)
+# wait briefly for a free connection instead of opening unbounded sockets; keepalive +
+# health checks drop dead idle connections before they are reused.
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "128"))
 
 try:
-    cache = Redis.from_url(REDIS_URL, decode_responses=True, encoding="utf-8")
+    # Values stay as raw bytes: orjson parses bytes directly and cached responses are written
+    # to the socket as-is, so decoding to str first would just be an extra copy per hit
+    redis_pool = BlockingConnectionPool.from_url(
+        REDIS_URL,
+        decode_responses=False,
+        max_connections=REDIS_MAX_CONNECTIONS,
+        timeout=5,
+        socket_keepalive=True,
+        health_check_interval=30,
+    )
+    cache = Redis(connection_pool=redis_pool)
     logger.info("Redis cache connection established.")
 except Exception as e:
     logger.error(f"Could not initialize Redis. Caching will be disabled. Error: {e}")
+    redis_pool = None
     cache = None
 
+# --- SHARED HTTP CLIENT ---
+# One pooled client for every outbound call so TCP/TLS connections to Google,
+# Open Library and Wikidata are reused instead of re-handshaken per request.
+# HTTP/2 lets concurrent fan-out requests to the same host share one connection
+# (falls back to HTTP/1.1 where the server doesn't negotiate h2).
+http_client = httpx.AsyncClient(
+    http2=True,
+    timeout=httpx.Timeout(20.0, connect=5.0),
+    limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+)
+
+@app.on_event("shutdown")
+async def close_http_client():
+    await http_client.aclose()
+    await loc.http_client.aclose()
+    # A client built on an explicit pool doesn't own it, so the pool is closed separately
+    if redis_pool is not None:
+        await redis_pool.disconnect()
+
+def _cache_key(url: str, params: dict) -> (dict, str):
+    # Only copy when there is actually a None to drop
+    filtered_params = {k: v for k, v in params.items() if v is not None} if None in params.values() else params
+    # Canonical bytes (sorted-key JSON) rather than a repr of the items list, so the key only
+    # depends on the values. blake2b is non-cryptographic use here; 16 bytes is plenty.
+    payload = url.encode() + b"|" + orjson.dumps(filtered_params, option=orjson.OPT_SORT_KEYS)
+    key = hashlib.blake2b(payload, digest_size=16).hexdigest()
+    return filtered_params, key
+
+async def _fetch_upstream(url: str, filtered_params: dict) -> (Any, Optional[bytes]):
+    sem = _upstream_semaphore(url)
+    if sem is None: return await _http_get_json(url, filtered_params)
+    async with sem:
+        return await _http_get_json(url, filtered_params)
+
+async def _http_get_json(url: str, filtered_params: dict) -> (Any, Optional[bytes]):
+    # Returns (decoded, raw body). The raw bytes are what gets cached, so a miss never
+    # pays an extra orjson.dumps just to write back what upstream already sent as JSON.
+    try:
+        resp = await http_client.get(url, params=filtered_params, timeout=20.0)
+        if resp.status_code == 404: return {}, None
+        # Gracefully handle 429 from Upstream (Google/LOC) to prevent crashes
+        if resp.status_code == 429:
+            logger.error(f"UPSTREAM RATE LIMIT: {url}")
+            raise HTTPException(status_code=429, detail="Upstream provider is rate limiting us.")
+        resp.raise_for_status()
+        raw = resp.content
+        return orjson.loads(raw), raw
+    except httpx.HTTPError as e:
+        logger.error(f"HTTPX error for {e.request.url!r}: {e}")
+        return {}, None
+
+# --- SINGLE-FLIGHT ---
+# Concurrent cold-cache requests for the same key share one upstream fetch instead of each
+# hitting Google/Open Library. Followers get the leader's result object, so callers must
+# treat it as read-only. The fetch runs as its own task and every caller (leader included)
+# awaits it through shield, so a cancelled caller (e.g. a client disconnect) never cancels
+# the fetch other requests are waiting on.
+_inflight: Dict[str, asyncio.Task] = {}
+
+def _single_flight_done(key: str, task: asyncio.Task) -> None:
+    if _inflight.get(key) is task:
+        del _inflight[key]
+    # mark retrieved so asyncio doesn't warn when every caller was cancelled
+    if not task.cancelled(): task.exception()
+
+async def _fetch_single_flight(url: str, filtered_params: dict, key: str) -> (Any, Optional[bytes]):
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_upstream(url, filtered_params))
+        _inflight[key] = task
+        task.add_done_callback(lambda t: _single_flight_done(key, t))
+    return await asyncio.shield(task)
+
+# --- LOCAL MICRO-CACHE ---
+# Short-lived per-process copy of hot cache values in front of Redis, so a burst of requests
+# for the same ISBN/query skips the Redis round-trip. Raw JSON bytes are kept (not parsed
+# objects) so every caller still decodes its own copy.
+LOCAL_CACHE_TTL = 5.0
+LOCAL_CACHE_MAX_ENTRIES = 10_000
+_local_cache: Dict[str, tuple] = {}
+
+def _local_get(key: str) -> Optional[bytes]:
+    entry = _local_cache.get(key)
+    if entry is None: return None
+    if entry[0] < time.monotonic():
+        _local_cache.pop(key, None)
+        return None
+    return entry[1]
+
+def _local_set(key: str, raw: bytes) -> None:
+    if len(_local_cache) >= LOCAL_CACHE_MAX_ENTRIES:
+        # dicts keep insertion order, so this drops the oldest entry
+        _local_cache.pop(next(iter(_local_cache)), None)
+    _local_cache[key] = (time.monotonic() + LOCAL_CACHE_TTL, raw)
+
 async def cached_get(
     url: str,
     params: dict,
     timeout_seconds: int = 3600 * 24 * 7 
 ) -> Any:
-    filtered_params = {k: v for k, v in params.items() if v is not None}
-    key = hashlib.sha256(f"{url}{sorted(filtered_params.items())}".encode()).hexdigest()
+    filtered_params, key = _cache_key(url, params)
+
+    raw = _local_get(key)
+    if raw is not None: return orjson.loads(raw)
 
     if cache:
         try:
             cached_data = await cache.get(key)
             if cached_data:
-                return json.loads(cached_data)
+                _local_set(key, cached_data)
+                return orjson.loads(cached_data)
         except Exception as e:
             logger.warning(f"Redis GET error: {e}", exc_info=True)
 
-    try:
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(url, params=filtered_params, timeout=20.0)
-            if resp.status_code == 404: return {} 
-            # Gracefully handle 429 from Upstream (Google/LOC) to prevent crashes
-            if resp.status_code == 429:
-                logger.error(f"UPSTREAM RATE LIMIT: {url}")
-                raise HTTPException(status_code=429, detail="Upstream provider is rate limiting us.")
-            resp.raise_for_status()
-            data = resp.json()
-    except httpx.HTTPError as e:
-        logger.error(f"HTTPX error for {e.request.url!r}: {e}")
-        return {}
+    data, raw = await _fetch_single_flight(url, filtered_params, key)
+
+    if data and raw:
+        _local_set(key, raw)
+        if cache:
+            try:
+                await cache.setex(key, timeout_seconds, raw)
+            except Exception as e:
+                logger.warning(f"Redis SET error: {e}", exc_info=True)
 
-    if cache and data:
+    return data
+
+async def cached_get_many(
+    requests: List[tuple],
+    timeout_seconds: int = 3600 * 24 * 7
+) -> List[Any]:
+    # Batch form of cached_get for (url, params) pairs: one MGET round-trip for every key,
+    # upstream fetches only for the misses, then one pipelined SETEX for what came back.
+    if not requests: return []
+    prepared = [_cache_key(url, params) for url, params in requests]
+    keys = [key for _, key in prepared]
+
+    results: List[Any] = [None] * len(requests)
+    remote = []
+    for i, key in enumerate(keys):
+        raw = _local_get(key)
+        if raw is not None: results[i] = orjson.loads(raw)
+        else: remote.append(i)
+
+    if not remote: return results
+
+    cached_values = [None] * len(remote)
+    if cache:
         try:
-            await cache.setex(key, timeout_seconds, json.dumps(data))
+            cached_values = await cache.mget([keys[i] for i in remote])
         except Exception as e:
-            logger.warning(f"Redis SET error: {e}", exc_info=True)
+            logger.warning(f"Redis MGET error: {e}", exc_info=True)
+
+    misses = []
+    for i, cached_data in zip(remote, cached_values):
+        if cached_data:
+            _local_set(keys[i], cached_data)
+            results[i] = orjson.loads(cached_data)
+        else: misses.append(i)
+
+    if not misses: return results
+
+    fetches = [_fetch_single_flight(requests[i][0], prepared[i][0], keys[i]) for i in misses]
+    fetched = await asyncio.gather(*fetches)
+
+    pipe = cache.pipeline(transaction=False) if cache else None
+    for i, (data, raw) in zip(misses, fetched):
+        results[i] = data
+        if not data or not raw: continue
+        _local_set(keys[i], raw)
+        if pipe is not None: pipe.setex(keys[i], timeout_seconds, raw)
+    if pipe is not None and len(pipe):
+        try:
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Redis pipelined SET error: {e}", exc_info=True)
 
-    return data
+    return results
 
 
 # --------------------------------------------------------------------
@@ -275,16 +524,6 @@ class AuthorPageData(BaseModel):
     books: List[SearchResultItem] = Field(default_factory=list)
     source: str 
 
-class AuthorBio(BaseModel):
-    value: str
-
-class AuthorDetails(BaseModel):
-    key: str
-    name: str
-    bio: Optional[AuthorBio | str] = None
-    birth_date: Optional[str] = None
-    death_date: Optional[str] = None
-    
 class WorkEdition(BaseModel):
     key: str
     title: str
@@ -317,43 +556,86 @@ class CacheStats(BaseModel):
 # 3. Helper Functions & Heuristics
 # --------------------------------------------------------------------
 
+# --- RESPONSE CACHE ---
+# Second cache tier on top of cached_get: the final serialized JSON of list endpoints, so a hit
+# skips the upstream fan-out, the mappers, the merge and serialization entirely.
+RESPONSE_CACHE_TTL = 3600
+
+async def get_cached_response(key: str) -> Optional[Response]:
+    if not cache: return None
+    try:
+        body = await cache.get(key)
+    except Exception as e:
+        logger.warning(f"Redis GET error: {e}", exc_info=True)
+        return None
+    return Response(content=body, media_type="application/json") if body else None
+
+async def cache_model_response(key: str, model: BaseModel, store: bool = True, timeout_seconds: int = RESPONSE_CACHE_TTL) -> Response:
+    body = model.model_dump_json()
+    if cache and store:
+        try:
+            await cache.setex(key, timeout_seconds, body)
+        except Exception as e:
+            logger.warning(f"Redis SET error: {e}", exc_info=True)
+    return Response(content=body, media_type="application/json")
+
 def ensure_https(url: Optional[str]) -> Optional[str]:
     if not url: return None
-    secure_url = url.replace("http://", "https://")
-    if "books.google.com" in secure_url:
-        secure_url = secure_url.replace("&edge=curl", "")
-    return secure_url
+    if url.startswith("http://"): url = "https://" + url[7:]
+    if "books.google.com" in url:
+        url = url.replace("&edge=curl", "")
+    return url
 
-def generate_high_res_url(url: Optional[str]) -> Optional[str]:
-    if not url: return None
-    clean_url = ensure_https(url)
-    if "zoom=1" in clean_url:
-        return clean_url.replace("zoom=1", "zoom=0")
-    return clean_url
+def _build_google_covers(links: Dict[str, Any]) -> GoogleCoverLinks:
+    raw_thumbnail = ensure_https(links.get("thumbnail"))
+    # The zoom=0 upgrade of the thumbnail backs both large sizes; compute it at most once.
+    # str.replace hands back the same object when there's no match, so no need to test first.
+    high_res = raw_thumbnail.replace("zoom=1", "zoom=0") if raw_thumbnail else None
+    return GoogleCoverLinks.model_construct(
+        thumbnail=raw_thumbnail,
+        smallThumbnail=ensure_https(links.get("smallThumbnail")),
+        small=ensure_https(links.get("small")),
+        medium=ensure_https(links.get("medium")),
+        large=ensure_https(links.get("large")) or high_res,
+        extraLarge=ensure_https(links.get("extraLarge")) or high_res
+    )
+
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+WHITESPACE_RE = re.compile(r'\s+')
+# Descriptions longer than this are cleaned in a worker thread so they don't stall the event loop
+HTML_OFFLOAD_THRESHOLD = 4096
 
 def clean_html_text(text: Optional[str]) -> Optional[str]:
     if not text: return None
-    clean = re.sub(r'<[^>]+>', ' ', text)
-    clean = clean.replace("&quot;", '"').replace("&apos;", "'").replace("&amp;", "&")
-    return re.sub(r'\s+', ' ', clean).strip()
+    # html.unescape is a single C-level pass (and a no-op without "&"), replacing the
+    # &quot;/&apos;/&amp; replace chain while also covering the rest of the entity set
+    clean = html.unescape(HTML_TAG_RE.sub(' ', text))
+    return WHITESPACE_RE.sub(' ', clean).strip()
+
+async def clean_html_text_async(text: Optional[str]) -> Optional[str]:
+    if text and len(text) > HTML_OFFLOAD_THRESHOLD:
+        return await asyncio.to_thread(clean_html_text, text)
+    return clean_html_text(text)
+
+# Compiled once; detect_series runs for every mapped search result
+SERIES_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r"(?P<name>.+?),?\s+Book\s+(?P<order>\d+)",
+    r"Book\s+(?P<order>\d+)\s+of\s+(?P<name>.+)",
+    r"(?P<name>.+?)\s+Trilogy",
+    r"(?P<name>.+?)\s+Series"
+)]
+SERIES_NAME_STOP_WORDS = frozenset({"fiction", "novel", "edition"})
 
 def detect_series(title: str, subtitle: Optional[str]) -> Optional[SeriesInfo]:
     full_text = f"{title} {subtitle or ''}"
-    patterns = [
-        r"(?P<name>.+?),?\s+Book\s+(?P<order>\d+)",
-        r"Book\s+(?P<order>\d+)\s+of\s+(?P<name>.+)",
-        r"(?P<name>.+?)\s+Trilogy",
-        r"(?P<name>.+?)\s+Series"
-    ]
-    
-    for pat in patterns:
-        match = re.search(pat, full_text, re.IGNORECASE)
+    for pat in SERIES_PATTERNS:
+        match = pat.search(full_text)
         if match:
             groups = match.groupdict()
             order = int(groups['order']) if 'order' in groups else None
             name = groups['name'].strip()
-            if len(name) > 50 or name.lower() in ["fiction", "novel", "edition"]: continue
-            return SeriesInfo(name=name, order=order)
+            if len(name) > 50 or name.lower() in SERIES_NAME_STOP_WORDS: continue
+            return SeriesInfo.model_construct(name=name, order=order)
     return None
 
 def classify_format(page_count: Optional[int], is_ebook: bool) -> str:
@@ -370,85 +652,108 @@ def check_content_safety(description: Optional[str], categories: List[str]) -> O
         return "Mature Content"
     return None
 
+GENRE_KEYWORDS = {
+    "vampire": "Paranormal", "werewolf": "Paranormal", "witch": "Fantasy",
+    "space": "Sci-Fi", "alien": "Sci-Fi", "robot": "Sci-Fi", 
+    "detective": "Mystery", "murder": "Mystery", "crime": "Mystery", "police": "Mystery",
+    "spy": "Thriller", "espionage": "Thriller", "agent": "Thriller",
+    "dragon": "Fantasy", "magic": "Fantasy", "wizard": "Fantasy", "kingdom": "Fantasy",
+    "marriage": "Romance", "kiss": "Romance",
+    "computer": "Technology", "ai": "Technology"
+}
+# One alternation scan instead of a substring search per keyword. The zero-width lookahead
+# tries every position, so matches keep the old plain-substring semantics (overlaps included).
+GENRE_KEYWORD_RE = re.compile(
+    "(?=(" + "|".join(map(re.escape, sorted(GENRE_KEYWORDS, key=len, reverse=True))) + "))"
+)
+
 def heuristic_tagging(text: str, existing_tags: List[str]) -> List[str]:
-    GENRE_KEYWORDS = {
-        "vampire": "Paranormal", "werewolf": "Paranormal", "witch": "Fantasy",
-        "space": "Sci-Fi", "alien": "Sci-Fi", "robot": "Sci-Fi", 
-        "detective": "Mystery", "murder": "Mystery", "crime": "Mystery", "police": "Mystery",
-        "spy": "Thriller", "espionage": "Thriller", "agent": "Thriller",
-        "dragon": "Fantasy", "magic": "Fantasy", "wizard": "Fantasy", "kingdom": "Fantasy",
-        "marriage": "Romance", "kiss": "Romance",
-        "computer": "Technology", "ai": "Technology"
-    }
     inferred_tags = set(existing_tags)
-    lower_text = text.lower()
-    for keyword, tag in GENRE_KEYWORDS.items():
-        if keyword in lower_text:
-            inferred_tags.add(tag)
-    return sorted(list(inferred_tags))
-
-def _process_rich_categories(raw_categories: List[Any]) -> List[str]:
-    if not raw_categories: return []
-    unique_tags = set()
-    stop_words = {"general", "electronic books", "books", "juvenile fiction", "young adult fiction"}
-    
-    for cat in raw_categories:
+    for match in GENRE_KEYWORD_RE.finditer(text.lower()):
+        inferred_tags.add(GENRE_KEYWORDS[match.group(1)])
+    return sorted(inferred_tags)
+
+CATEGORY_SPLIT_RE = re.compile(r'[\/]+|--')
+CATEGORY_STOP_WORDS = frozenset({"general", "electronic books", "books", "juvenile fiction", "young adult fiction"})
+
+@lru_cache(maxsize=8192)
+def _explode_category(cat_str: str) -> tuple:
+    # Pure per-string split/strip/filter. The same raw strings ("Fiction / Fantasy / Epic")
+    # recur across books and queries, so this is almost always a cache hit after warmup.
+    # Tags are interned so set hashing/equality downstream is mostly pointer checks.
+    tags = []
+    for part in CATEGORY_SPLIT_RE.split(cat_str):
+        clean = part.strip()
+        if clean and clean.lower() not in CATEGORY_STOP_WORDS:
+            tags.append(sys.intern(clean))
+    return tuple(tags)
+
+def _collect_category_tags(raw_categories: List[Any], unique_tags: set) -> set:
+    # Adds cleaned tags into unique_tags (unsorted)
+    for cat in raw_categories or []:
         if isinstance(cat, dict): cat_str = cat.get("name", "")
         elif isinstance(cat, str): cat_str = cat
         else: continue
 
-        if not cat_str: continue
-        parts = re.split(r'[\/]+|--', cat_str)
-        
-        for part in parts:
-            clean = part.strip()
-            if not clean: continue
-            if clean.lower() in stop_words: continue
-            unique_tags.add(clean)
+        if cat_str: unique_tags.update(_explode_category(cat_str))
 
-    return sorted(list(unique_tags))
+    return unique_tags
 
 async def get_admin_key(x_admin_key: str = Header(None)):
     if not ADMIN_KEY: raise HTTPException(status_code=500, detail="Admin not configured.")
     if x_admin_key != ADMIN_KEY: raise HTTPException(status_code=401, detail="Invalid key.")
     return True
 
+# Checksum weights; the ASCII bias lets us sum raw byte values and correct for '0' (48) once
+ISBN10_WEIGHTS = (10, 9, 8, 7, 6, 5, 4, 3, 2)
+ISBN13_WEIGHTS = (1, 3) * 6
+ISBN10_ASCII_BIAS = 48 * sum(ISBN10_WEIGHTS)
+ISBN13_ASCII_BIAS = 48 * sum(ISBN13_WEIGHTS)
+
+def _weighted_digit_sum(ascii_digits: bytes, weights: tuple, bias: int) -> int:
+    # map(mul) over bytes runs entirely in C: no per-digit int() calls
+    return sum(map(mul, ascii_digits, weights)) - bias
+
 def _is_valid_isbn10_checksum(isbn: str) -> bool:
-    if len(isbn) != 10 or not isbn[:-1].isdigit(): return False
-    total = sum(int(isbn[i]) * (10 - i) for i in range(9))
-    check_digit = isbn[-1].upper()
-    if check_digit == 'X': total += 10
-    elif check_digit.isdigit(): total += int(check_digit)
+    if len(isbn) != 10 or not isbn.isascii() or not isbn[:-1].isdigit(): return False
+    raw = isbn.encode("ascii")
+    total = _weighted_digit_sum(raw, ISBN10_WEIGHTS, ISBN10_ASCII_BIAS)
+    check_digit = raw[9]
+    if check_digit in b"Xx": total += 10
+    elif 48 <= check_digit <= 57: total += check_digit - 48
     else: return False
     return total % 11 == 0
 
 def _is_valid_isbn13_checksum(isbn: str) -> bool:
-    if len(isbn) != 13 or not isbn.isdigit(): return False
-    total = 0
-    for i in range(12):
-        digit = int(isbn[i])
-        total += digit * (1 if i % 2 == 0 else 3)
-        check_digit = (10 - (total % 10)) % 10
-    return check_digit == int(isbn[12])
+    if len(isbn) != 13 or not isbn.isascii() or not isbn.isdigit(): return False
+    raw = isbn.encode("ascii")
+    total = _weighted_digit_sum(raw, ISBN13_WEIGHTS, ISBN13_ASCII_BIAS)
+    return (10 - (total % 10)) % 10 == raw[12] - 48
 
 def _convert_isbn10_to_isbn13(isbn10: str) -> str:
     base = f"978{isbn10[:-1]}"
-    total = sum(int(base[i]) * (1 if i % 2 == 0 else 3) for i in range(12))
+    total = _weighted_digit_sum(base.encode("ascii"), ISBN13_WEIGHTS, ISBN13_ASCII_BIAS)
     check_digit = (10 - (total % 10)) % 10
     return f"{base}{check_digit}"
 
+ISBN_SEPARATOR_RE = re.compile(r"[\s-]+")
+
 def validate_and_clean_isbn(isbn: str = FastAPIPath(...)) -> str:
-    cleaned = re.sub(r"[\s-]+", "", isbn)
+    # Most callers already send bare digits; only run the separator regex when needed
+    cleaned = isbn if isbn.isalnum() else ISBN_SEPARATOR_RE.sub("", isbn)
     if len(cleaned) == 13 and _is_valid_isbn13_checksum(cleaned): return cleaned
     if len(cleaned) == 10 and _is_valid_isbn10_checksum(cleaned): return _convert_isbn10_to_isbn13(cleaned)
-    if cleaned.isdigit() and len(cleaned) >= 8: return cleaned 
+    if len(cleaned) >= 8 and cleaned.isascii() and cleaned.isdigit(): return cleaned 
     raise HTTPException(status_code=400, detail="Invalid ISBN or Identifier.")
 
 def _get_isbns_from_google_item(item: Dict[str, Any]) -> (Optional[str], Optional[str]):
     isbn_13, isbn_10 = None, None
-    for i in item.get("volumeInfo", {}).get("industryIdentifiers", []):
-        if i.get("type") == "ISBN_13" and not isbn_13: isbn_13 = i.get("identifier")
-        elif i.get("type") == "ISBN_10" and not isbn_10: isbn_10 = i.get("identifier")
+    for i in item.get("volumeInfo", {}).get("industryIdentifiers") or ():
+        id_type = i.get("type")
+        if id_type == "ISBN_13" and not isbn_13: isbn_13 = i.get("identifier")
+        elif id_type == "ISBN_10" and not isbn_10: isbn_10 = i.get("identifier")
+        else: continue
+        if isbn_13 and isbn_10: break
     return isbn_13, isbn_10
 
 def _get_isbns_from_ol_item(item: Dict[str, Any]) -> (Optional[str], Optional[str]):
@@ -460,40 +765,30 @@ def _get_isbns_from_ol_item(item: Dict[str, Any]) -> (Optional[str], Optional[st
 
 
 # --- MAPPERS ---
+# Mapper outputs are assembled field-by-field from upstream payloads we shape here,
+# so they are built with model_construct (no per-field validation).
 
 def _google_item_to_search_result(item: Dict[str, Any]) -> SearchResultItem:
     g_info = item.get("volumeInfo", {})
     isbn_13, isbn_10 = _get_isbns_from_google_item(item)
-    links = g_info.get("imageLinks", {})
-    raw_thumbnail = ensure_https(links.get("thumbnail"))
-    extra_large = ensure_https(links.get("extraLarge"))
-    if not extra_large and raw_thumbnail: extra_large = generate_high_res_url(raw_thumbnail)
-    large = ensure_https(links.get("large"))
-    if not large and raw_thumbnail: large = generate_high_res_url(raw_thumbnail)
-
-    g_covers = GoogleCoverLinks(
-        thumbnail=raw_thumbnail,
-        smallThumbnail=ensure_https(links.get("smallThumbnail")),
-        small=ensure_https(links.get("small")),
-        medium=ensure_https(links.get("medium")),
-        large=large,
-        extraLarge=extra_large
-    )
+    g_covers = _build_google_covers(g_info.get("imageLinks", {}))
     cover_url = g_covers.thumbnail or g_covers.smallThumbnail or g_covers.small or g_covers.medium
     if not cover_url:
         cover_id = isbn_13 if isbn_13 else isbn_10
         if cover_id: cover_url = f"https://covers.openlibrary.org/b/isbn/{cover_id}-M.jpg"
 
     raw_authors = g_info.get("authors", [])
-    author_objects = [AuthorItem(name=a, key=None) for a in raw_authors]
-    smart_cats = _process_rich_categories(g_info.get("categories", []))
-    if len(smart_cats) < 2:
+    author_objects = [AuthorItem.model_construct(name=a, key=None, bio=None) for a in raw_authors]
+    cat_tags = _collect_category_tags(g_info.get("categories", []), set())
+    if len(cat_tags) < 2:
         desc_text = g_info.get("description", "") + " " + g_info.get("title", "")
-        smart_cats = heuristic_tagging(desc_text, smart_cats)
+        smart_cats = heuristic_tagging(desc_text, cat_tags)
+    else:
+        smart_cats = sorted(cat_tags)
     series = detect_series(g_info.get("title", ""), g_info.get("subtitle"))
     fmt = classify_format(g_info.get("pageCount"), item.get("saleInfo", {}).get("isEbook", False))
 
-    return SearchResultItem(
+    return SearchResultItem.model_construct(
         title=g_info.get("title", "No Title"),
         subtitle=g_info.get("subtitle"),
         authors=author_objects,
@@ -519,13 +814,14 @@ def _ol_item_to_search_result(item: Dict[str, Any]) -> SearchResultItem:
     author_objects = []
     for i, name in enumerate(raw_names):
         key = raw_keys[i] if i < len(raw_keys) else None
-        author_objects.append(AuthorItem(name=name, key=key))
-    smart_cats = _process_rich_categories(item.get("subject", []))[:8]
+        author_objects.append(AuthorItem.model_construct(name=name, key=key, bio=None))
+    # OL subject lists run to hundreds of entries; only the first 8 (sorted) are kept
+    smart_cats = heapq.nsmallest(8, _collect_category_tags(item.get("subject", []), set()))
     pub_date = str(item.get("first_publish_year")) if item.get("first_publish_year") else None
     cover_url = None
     if "cover_i" in item:
          cover_url = f"https://covers.openlibrary.org/b/id/{item['cover_i']}-M.jpg"
-    return SearchResultItem(
+    return SearchResultItem.model_construct(
         title=item.get("title", "No Title"),
         subtitle=item.get("subtitle"),
         authors=author_objects,
@@ -544,11 +840,11 @@ def _loc_item_to_search_result(item: Dict[str, Any]) -> SearchResultItem:
     author_objects = []
     for a in raw_authors:
         if isinstance(a, dict):
-            author_objects.append(AuthorItem(name=a.get("name", "Unknown")))
+            author_objects.append(AuthorItem.model_construct(name=a.get("name", "Unknown"), key=None, bio=None))
         elif isinstance(a, str):
-            author_objects.append(AuthorItem(name=a))
+            author_objects.append(AuthorItem.model_construct(name=a, key=None, bio=None))
 
-    return SearchResultItem(
+    return SearchResultItem.model_construct(
         title=item.get("title", "Untitled Document"),
         subtitle=item.get("description")[:100] if item.get("description") else None,
         authors=author_objects,
@@ -559,9 +855,14 @@ def _loc_item_to_search_result(item: Dict[str, Any]) -> SearchResultItem:
         description=item.get("description"),
         format_tag="Primary Source",
         data_sources=["Library of Congress"],
-        lccn=item.get("lccn")
+        lccn=item.get("lccn") or []
     )
 
+NON_ALNUM_RE = re.compile(r'[^a-z0-9]')
+
+def _norm_for_match(s: Any) -> str:
+    return NON_ALNUM_RE.sub('', str(s).lower())
+
 def _merge_and_deduplicate_results(
     google_results: List[SearchResultItem],
     ol_results: List[SearchResultItem],
@@ -569,32 +870,42 @@ def _merge_and_deduplicate_results(
     query: str = "" 
 ) -> List[SearchResultItem]:
     merged_books: Dict[str, SearchResultItem] = {}
+    # title|author fallback key -> merge key of the first book seen with it, so ISBN-less
+    # items (OL without ISBN, LOC) can still find a twin that was keyed by ISBN
+    fallback_index: Dict[str, str] = {}
     
     def get_fallback_key(item: SearchResultItem):
         if not item.authors: return f"noauth-{item.title.lower().strip()}"
         return f"{item.title.lower().strip()}|{item.authors[0].name.lower().strip()}"
 
     for item in google_results:
-        key = item.isbn_13 or get_fallback_key(item)
-        if key: merged_books[key] = item
+        fallback_key = get_fallback_key(item)
+        key = item.isbn_13 or fallback_key
+        merged_books[key] = item
+        fallback_index.setdefault(fallback_key, key)
 
     for item in ol_results:
-        key = item.isbn_13 or get_fallback_key(item)
-        if not key: continue
-        if key in merged_books:
-            existing = merged_books[key]
+        fallback_key = get_fallback_key(item)
+        key = item.isbn_13 or fallback_key
+        existing = merged_books.get(key)
+        if existing is None and not item.isbn_13:
+            existing = merged_books.get(fallback_index.get(fallback_key))
+        if existing is not None:
             if not existing.open_library_work_id: existing.open_library_work_id = item.open_library_work_id
             if not existing.authors and item.authors: existing.authors = item.authors
             if "Open Library" not in existing.data_sources:
                  existing.data_sources.append("Open Library")
         else:
             merged_books[key] = item
+            fallback_index.setdefault(fallback_key, key)
 
-    clean_loc_results = [_loc_item_to_search_result(item) for item in loc_results]
-    for item in clean_loc_results:
+    for raw_item in loc_results:
+        item = _loc_item_to_search_result(raw_item)
         key = get_fallback_key(item) 
-        if key in merged_books:
-             existing = merged_books[key]
+        existing = merged_books.get(key)
+        if existing is None:
+            existing = merged_books.get(fallback_index.get(key))
+        if existing is not None:
              if "Library of Congress" not in existing.data_sources:
                  existing.data_sources.append("Library of Congress")
              existing.format_tag = "Primary Source"
@@ -602,6 +913,11 @@ def _merge_and_deduplicate_results(
                  existing.lccn = item.lccn
         else:
              merged_books[key] = item
+             fallback_index.setdefault(key, key)
+
+    # list.sort calls the key once per book, so everything query-derived is hoisted out
+    # of score_book and computed once per merge instead of once (or twice) per book.
+    q_clean = _norm_for_match(query) if query else ""
 
     def score_book(book: SearchResultItem) -> int:
         score = 0
@@ -612,31 +928,25 @@ def _merge_and_deduplicate_results(
         
         # --- PHASE 2 & 3: RELEVANCE BOOSTING ---
         if query:
-            def norm(s): return re.sub(r'[^a-z0-9]', '', str(s).lower())
-            q_clean = norm(query)
-
             # TITLE MATCH BOOST
             if book.title:
-                t_clean = norm(book.title)
+                t_clean = _norm_for_match(book.title)
                 if q_clean == t_clean:
                     score += 500 
+                    # INDIE RESCUE
+                    if not book.cover_url: score += 200
                 elif q_clean in t_clean and len(q_clean) > 5:
                     score += 20  
 
             # AUTHOR AUTHORITY BOOST
             if book.authors:
                 for author in book.authors:
-                    a_clean = norm(author.name)
+                    a_clean = _norm_for_match(author.name)
                     if q_clean == a_clean:
                         score += 600 
                     elif q_clean in a_clean and len(q_clean) > 4:
                         score += 100 
 
-            # INDIE RESCUE
-            if book.title and not book.cover_url:
-                if norm(query) == norm(book.title):
-                    score += 200
-
         return score
 
     final_list = list(merged_books.values())
@@ -650,8 +960,7 @@ def _merge_and_deduplicate_results(
 
 async def get_google_data_by_isbn(isbn: str) -> dict:
     if not API_KEY: return {}
-    FIELDS = "totalItems,items(id,volumeInfo(title,subtitle,authors,publisher,publishedDate,description,pageCount,averageRating,ratingsCount,categories,dimensions,imageLinks(thumbnail,smallThumbnail,small,medium,large,extraLarge),industryIdentifiers,language),saleInfo,accessInfo)"
-    params = {"q": f"isbn:{isbn}", "key": API_KEY, "fields": FIELDS}
+    params = {"q": f"isbn:{isbn}", "key": API_KEY, "fields": GOOGLE_ISBN_FIELDS}
     data = await cached_get(GOOGLE_BOOKS_API_URL, params)
     if data.get("totalItems", 0) > 0 and "items" in data:
         return data["items"][0]
@@ -662,15 +971,48 @@ async def get_open_library_data_by_isbn(isbn: str) -> dict:
     data = await cached_get(f"{OPEN_LIBRARY_API_URL}/api/books", params)
     return data.get(f"ISBN:{isbn}", {})
 
-async def get_open_library_work_details(work_key: str) -> dict:
+def _ol_work_url(work_key: str) -> str:
     if not work_key.startswith("/works/"):
         work_key = f"/works/{work_key.split('/')[-1]}" 
-    url = f"{OPEN_LIBRARY_API_URL}{work_key}.json"
-    return await cached_get(url, params={})
+    return f"{OPEN_LIBRARY_API_URL}{work_key}.json"
+
+OL_AUTHOR_FETCH_LIMIT = 25
+
+def _ol_author_url(author_key: str) -> str:
+    return f"{OPEN_LIBRARY_API_URL}/authors/{author_key}.json"
+
+async def get_open_library_book_bundle(isbn: str) -> (dict, Optional[dict], List[dict]):
+    # OL edition lookup, then its work + author records (which need keys from the edition)
+    open_library_book = await get_open_library_data_by_isbn(isbn)
+    if not open_library_book: return {}, None, []
+
+    # Work details + author bios go out as one batch: a single Redis MGET, upstream only for misses
+    secondary_requests = []
+    work_key = None
+    ol_works = open_library_book.get("works", [])
+    if ol_works and isinstance(ol_works[0], dict) and "key" in ol_works[0]:
+        work_key = ol_works[0]["key"]
+        secondary_requests.append((_ol_work_url(work_key), {}))
+
+    # Every author is probed (the MGET covers them all); upstream misses are throttled by
+    # OL_SEM rather than by dropping co-authors. Keys are de-duplicated, and the cap only
+    # guards against anthology editions that list dozens of contributors.
+    author_keys_to_fetch = {}
+    for a in open_library_book.get("authors", []):
+        if "author" in a and "key" in a["author"]: author_keys_to_fetch[a["author"]["key"]] = None
+        elif "key" in a: author_keys_to_fetch[a["key"]] = None
+
+    secondary_requests.extend((_ol_author_url(k), {}) for k in list(author_keys_to_fetch)[:OL_AUTHOR_FETCH_LIMIT])
+    secondary_results = await cached_get_many(secondary_requests)
+    work_data = secondary_results[0] if work_key else None
+    author_details_list = secondary_results[1:] if work_key else secondary_results
+    return open_library_book, work_data, author_details_list
+
+async def get_open_library_work_details(work_key: str) -> dict:
+    return await cached_get(_ol_work_url(work_key), params={})
 
 async def search_google(q: str, limit: int, start_index: int, subject: Optional[str] = None) -> List[SearchResultItem]:
     if not API_KEY: return []
-    FIELDS = "items(id,volumeInfo(title,subtitle,authors,publisher,publishedDate,averageRating,ratingsCount,categories,imageLinks(thumbnail,small),industryIdentifiers,description,pageCount))"
     query_string = f"{q} subject:{subject}" if subject else q
     params = {
         "q": query_string, 
@@ -678,31 +1020,40 @@ async def search_google(q: str, limit: int, start_index: int, subject: Optional[
         "maxResults": limit, 
         "startIndex": start_index,
         "langRestrict": "en",
-        "fields": FIELDS
+        "fields": GOOGLE_SEARCH_FIELDS
     }
     data = await cached_get(GOOGLE_BOOKS_API_URL, params)
     return [_google_item_to_search_result(item) for item in data.get("items", [])]
 
+# --- NEW-RELEASE DATE WINDOWS ---
+# The filters only change at month/year boundaries, so they are built once and refreshed
+# at most hourly instead of re-deriving them from the clock on every /new-releases page.
+RELEASE_WINDOW_REFRESH_SECONDS = 3600
+_release_windows: tuple = (0.0, None, None)
+
+def _release_date_filters() -> (str, str):
+    # (Open Library year filter, Google month filter)
+    global _release_windows
+    expires_at, ol_filter, google_filter = _release_windows
+    if ol_filter is not None and time.monotonic() < expires_at: return ol_filter, google_filter
+
+    now = datetime.now()
+    # Current Month + Previous Month, e.g. "2025-12" OR "2025-11"
+    prev_month = now.replace(day=1) - timedelta(days=1)
+    google_filter = f'("{now:%Y-%m}" OR "{prev_month:%Y-%m}")'
+    ol_filter = f"first_publish_year:[{now.year - 1} TO *]"
+    _release_windows = (time.monotonic() + RELEASE_WINDOW_REFRESH_SECONDS, ol_filter, google_filter)
+    return ol_filter, google_filter
+
 # NEW: Phase 2 - Google Relevance + Date Window Strategy
 async def get_google_new_releases(limit: int, start_index: int, subject: Optional[str] = None) -> List[SearchResultItem]:
     if not API_KEY: return []
     
-    # 1. Calculate Date Window (Current Month + Previous Month)
-    # This allows us to search for "2025-12" OR "2025-11" directly in the query.
-    now = datetime.now()
-    current_month_str = now.strftime("%Y-%m")
-    
-    # Calculate previous month
-    first_of_this_month = now.replace(day=1)
-    prev_month_date = first_of_this_month - timedelta(days=1)
-    prev_month_str = prev_month_date.strftime("%Y-%m")
-    
-    # 2. Construct Query: (subject:X) AND ("YYYY-MM" OR "YYYY-MM")
+    # Construct Query: (subject:X) AND ("YYYY-MM" OR "YYYY-MM")
     # We purposefully DO NOT use orderBy="newest". We want Google's RELEVANCE sort
     # to pick the "best" books from this date window.
     base_query = f"subject:{subject}" if subject else "subject:fiction"
-    date_filter = f'("{current_month_str}" OR "{prev_month_str}")'
-    final_query = f"{base_query} {date_filter}"
+    final_query = f"{base_query} {_release_date_filters()[1]}"
     
     params = {
         "q": final_query,
@@ -712,7 +1063,7 @@ async def get_google_new_releases(limit: int, start_index: int, subject: Optiona
         "langRestrict": "en",
         # "orderBy": "newest",  <-- REMOVED. We want Relevance!
         "printType": "books",
-        "fields": "items(id,volumeInfo(title,subtitle,authors,publisher,publishedDate,averageRating,ratingsCount,categories,imageLinks(thumbnail,small),industryIdentifiers,description,pageCount))"
+        "fields": GOOGLE_SEARCH_FIELDS
     }
     data = await cached_get(GOOGLE_BOOKS_API_URL, params, timeout_seconds=3600)
     return [_google_item_to_search_result(item) for item in data.get("items", [])]
@@ -722,7 +1073,7 @@ async def search_open_library(q: str, limit: int, offset: int, subject: Optional
         "q": q, 
         "limit": limit, 
         "offset": offset,
-        "fields": "title,subtitle,author_name,author_key,isbn,key,publisher,subject,first_publish_year,cover_i", 
+        "fields": OL_SEARCH_FIELDS,
         "subject": subject,
         "language": "eng" 
     }
@@ -730,24 +1081,21 @@ async def search_open_library(q: str, limit: int, offset: int, subject: Optional
     return [_ol_item_to_search_result(item) for item in data.get("docs", [])]
 
 async def get_open_library_new_releases(limit: int, offset: int, subject: Optional[str] = None) -> List[SearchResultItem]:
-    current_year = datetime.now().year
-    start_year = current_year - 1
     base_query = f"subject:{subject}" if subject else "language:eng"
-    date_query = f"first_publish_year:[{start_year} TO *]"
-    final_query = f"{base_query} {date_query}"
+    final_query = f"{base_query} {_release_date_filters()[0]}"
 
     params = {
         "q": final_query,
         "sort": "new",
         "limit": limit,
         "offset": offset,
-        "fields": "title,subtitle,author_name,author_key,isbn,key,publisher,subject,first_publish_year,cover_i", 
+        "fields": OL_SEARCH_FIELDS,
     }
     data = await cached_get(f"{OPEN_LIBRARY_API_URL}/search.json", params, timeout_seconds=3600)
     return [_ol_item_to_search_result(item) for item in data.get("docs", [])]
 
 async def get_open_library_author(author_key: str) -> dict:
-    return await cached_get(f"{OPEN_LIBRARY_API_URL}/authors/{author_key}.json", params={})
+    return await cached_get(_ol_author_url(author_key), params={})
 
 async def get_open_library_work_editions(work_key: str) -> dict:
     url = f"{OPEN_LIBRARY_API_URL}/works/{work_key}/editions.json"
@@ -774,19 +1122,18 @@ async def get_wikidata_profile(author_name: str) -> Optional[Dict[str, Any]]:
     }
     
     try:
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(WIKIDATA_SPARQL_URL, params=params, headers=headers, timeout=5.0)
-            if resp.status_code == 200:
-                data = resp.json()
-                bindings = data.get("results", {}).get("bindings", [])
-                if bindings:
-                    res = bindings[0]
-                    return {
-                        "bio": res.get("bio", {}).get("value"),
-                        "birth_date": res.get("birthDate", {}).get("value"),
-                        "death_date": res.get("deathDate", {}).get("value"),
-                        "photo_url": res.get("image", {}).get("value")
-                    }
+        resp = await http_client.get(WIKIDATA_SPARQL_URL, params=params, headers=headers, timeout=5.0)
+        if resp.status_code == 200:
+            data = orjson.loads(resp.content)
+            bindings = data.get("results", {}).get("bindings", [])
+            if bindings:
+                res = bindings[0]
+                return {
+                    "bio": res.get("bio", {}).get("value"),
+                    "birth_date": res.get("birthDate", {}).get("value"),
+                    "death_date": res.get("deathDate", {}).get("value"),
+                    "photo_url": res.get("image", {}).get("value")
+                }
     except Exception as e:
         logger.warning(f"Wikidata query failed for {author_name}: {e}")
     
@@ -804,22 +1151,33 @@ async def check_redis_health() -> ServiceHealth:
 async def check_google_health() -> ServiceHealth:
     if not API_KEY: return ServiceHealth(name="google_books", status="error", detail="GOOGLE_API_KEY not set.")
     try:
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(GOOGLE_BOOKS_API_URL, params={"q": "a", "maxResults": 1, "fields": "totalItems", "key": API_KEY}, timeout=5.0)
-            resp.raise_for_status()
+        resp = await http_client.get(GOOGLE_BOOKS_API_URL, params=GOOGLE_HEALTH_PARAMS, timeout=5.0)
+        resp.raise_for_status()
         return ServiceHealth(name="google_books", status="ok")
     except httpx.HTTPError as e:
         return ServiceHealth(name="google_books", status="error", detail=str(e))
 
 async def check_ol_health() -> ServiceHealth:
     try:
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(f"{OPEN_LIBRARY_API_URL}/works/OL45804W.json", timeout=5.0)
-            resp.raise_for_status()
+        resp = await http_client.get(f"{OPEN_LIBRARY_API_URL}/works/OL45804W.json", timeout=5.0)
+        resp.raise_for_status()
         return ServiceHealth(name="open_library", status="ok")
     except httpx.HTTPError as e:
         return ServiceHealth(name="open_library", status="error", detail=str(e))
 
+# Probes (k8s readiness, uptime monitors) can hit /health every second; reuse the last
+# result for a few seconds so they don't turn into a steady stream of Google/OL calls.
+HEALTH_CACHE_TTL = 10.0
+_health_cache: tuple = (0.0, None)
+
+async def get_service_health() -> List[ServiceHealth]:
+    global _health_cache
+    expires_at, results = _health_cache
+    if results is not None and time.monotonic() < expires_at: return results
+    results = await asyncio.gather(check_redis_health(), check_google_health(), check_ol_health())
+    _health_cache = (time.monotonic() + HEALTH_CACHE_TTL, results)
+    return results
+
 
 # --------------------------------------------------------------------
 # 5. API Endpoints
@@ -827,7 +1185,7 @@ async def check_ol_health() -> ServiceHealth:
 
 @app.get("/health", response_model=HealthResponse, tags=["Health & Stats"])
 async def get_health(response: Response, request: Request):
-    results = await asyncio.gather(check_redis_health(), check_google_health(), check_ol_health())
+    results = await get_service_health()
     if any(res.status == "error" for res in results):
         response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
         return HealthResponse(status="error", services=results)
@@ -852,9 +1210,16 @@ async def read_root(request: Request): return {"message": "Bookfinder Intelligen
 @limiter.limit("60/minute")
 async def get_fiction_genres(request: Request): return fiction.FICTION_GENRES
 
+@lru_cache(maxsize=1)
+def _non_fiction_genres_json() -> bytes:
+    # The taxonomy is static: encode it once per process instead of running the
+    # response_model validate + serialize pass on every request.
+    return orjson.dumps(non_fiction.get_non_fiction_genres())
+
 @app.get("/genres/non-fiction", response_model=List[non_fiction.Genre])
 @limiter.limit("60/minute")
-async def get_non_fiction_genres(request: Request): return non_fiction.NON_FICTION_GENRES
+async def get_non_fiction_genres(request: Request):
+    return Response(content=_non_fiction_genres_json(), media_type="application/json")
 
 def _merge_loc_data(book: MergedBook, loc_data: dict) -> MergedBook:
     if not loc_data:
@@ -870,8 +1235,9 @@ def _merge_loc_data(book: MergedBook, loc_data: dict) -> MergedBook:
     if loc_data.get("published_date"):
         book.published_date = loc_data["published_date"]
     if loc_data.get("subjects"):
-        combined = set(book.subjects + loc_data["subjects"])
-        book.subjects = sorted(list(combined))
+        combined = set(book.subjects)
+        combined.update(loc_data["subjects"])
+        book.subjects = sorted(combined)
     if not book.publisher and loc_data.get("publisher"):
         book.publisher = loc_data["publisher"]
     
@@ -891,21 +1257,20 @@ def _merge_loc_data(book: MergedBook, loc_data: dict) -> MergedBook:
 @limiter.limit("20/minute") 
 async def get_book_by_isbn(request: Request, isbn: str = Depends(validate_and_clean_isbn)):
     # 1. Determine ID Type
-    is_lccn = len(isbn) < 13 and isbn.isdigit()
+    is_lccn = len(isbn) < 13 and isbn.isascii() and isbn.isdigit()
     
     # 2. Strategy Split
     if is_lccn:
         # LCCN Mode: Only query LOC (using Item endpoint)
-        google_volume, open_library_book, loc_data = await asyncio.gather(
-            asyncio.sleep(0, result={}),
-            asyncio.sleep(0, result={}),
-            loc.get_loc_data_by_lccn(isbn) # Uses the new Item lookup!
-        )
+        google_volume, open_library_book, work_data, author_details_list = {}, {}, None, []
+        loc_data = await loc.get_loc_data_by_lccn(isbn) # Uses the new Item lookup!
     else:
         # Standard ISBN Mode: Query All
-        google_volume, open_library_book, loc_data = await asyncio.gather(
+        # Google + LOC don't depend on Open Library, so they run alongside the whole
+        # OL ISBN -> work/authors chain instead of waiting for it to start
+        google_volume, (open_library_book, work_data, author_details_list), loc_data = await asyncio.gather(
             get_google_data_by_isbn(isbn),
-            get_open_library_data_by_isbn(isbn),
+            get_open_library_book_bundle(isbn),
             loc.get_loc_data_by_isbn(isbn)
         )
     
@@ -913,63 +1278,47 @@ async def get_book_by_isbn(request: Request, isbn: str = Depends(validate_and_cl
         raise HTTPException(status_code=404, detail="Book not found.")
 
     g_info = google_volume.get("volumeInfo", {})
-    description = clean_html_text(g_info.get("description"))
+    description = await clean_html_text_async(g_info.get("description"))
     if not description:
         desc_raw = open_library_book.get("description")
-        if isinstance(desc_raw, dict): description = clean_html_text(desc_raw.get("value"))
-        elif isinstance(desc_raw, str): description = clean_html_text(desc_raw)
+        if isinstance(desc_raw, dict): description = await clean_html_text_async(desc_raw.get("value"))
+        elif isinstance(desc_raw, str): description = await clean_html_text_async(desc_raw)
         if not description and loc_data.get("description"):
-            description = clean_html_text(loc_data["description"])
-    
-    tasks = []
-    work_key = None
-    ol_works = open_library_book.get("works", [])
-    if ol_works and isinstance(ol_works[0], dict) and "key" in ol_works[0]:
-        work_key = ol_works[0]["key"]
-        tasks.append(get_open_library_work_details(work_key))
-    else:
-        tasks.append(asyncio.sleep(0))
-
-    ol_authors_list = open_library_book.get("authors", [])
-    author_keys_to_fetch = []
-    for a in ol_authors_list:
-        if "author" in a and "key" in a["author"]: author_keys_to_fetch.append(a["author"]["key"])
-        elif "key" in a: author_keys_to_fetch.append(a["key"])
+            description = await clean_html_text_async(loc_data["description"])
     
-    author_fetch_tasks = [get_open_library_author(k) for k in author_keys_to_fetch[:3]]
-    secondary_results = await asyncio.gather(tasks[0], *author_fetch_tasks)
-    work_data = secondary_results[0] if work_key else None
-    author_details_list = secondary_results[1:]
-
     if not description and work_data:
         raw_desc = work_data.get("description")
-        if isinstance(raw_desc, dict): description = clean_html_text(raw_desc.get("value"))
-        elif isinstance(raw_desc, str): description = clean_html_text(raw_desc)
+        if isinstance(raw_desc, dict): description = await clean_html_text_async(raw_desc.get("value"))
+        elif isinstance(raw_desc, str): description = await clean_html_text_async(raw_desc)
 
-    clean_g_categories = _process_rich_categories(g_info.get("categories", []))
-    clean_ol_subjects = _process_rich_categories(open_library_book.get("subjects", []))
-
-    work_tags = []
+    # Collect every source into one set; nothing is sorted until the final list is built
+    subject_set = set()
+    _collect_category_tags(g_info.get("categories", []), subject_set)
+    _collect_category_tags(open_library_book.get("subjects", []), subject_set)
     if work_data:
-        work_tags.extend(work_data.get("subjects", []))
-        work_tags.extend(work_data.get("subject_places", []))
-        work_tags.extend(work_data.get("subject_times", []))
-    
-    clean_work_tags = _process_rich_categories(work_tags)
-    combined_subjects = sorted(list(set(clean_g_categories + clean_ol_subjects + clean_work_tags)))
-    
+        for field in ("subjects", "subject_places", "subject_times"):
+            _collect_category_tags(work_data.get(field, []), subject_set)
+
     has_loc_subjects = loc_data and loc_data.get("subjects")
-    if not has_loc_subjects and len(combined_subjects) < 3 and description:
-        combined_subjects = sorted(list(set(combined_subjects + heuristic_tagging(description + " " + g_info.get("title", ""), combined_subjects))))
+    if not has_loc_subjects and len(subject_set) < 3 and description:
+        subject_set.update(heuristic_tagging(description + " " + g_info.get("title", ""), ()))
+
+    # Sort once, right before the response is assembled
+    combined_subjects = sorted(subject_set)
 
-    author_bio_map = {}
+    # Author records were already fetched as one batch in the bundle; clean the bios
+    # concurrently too, since long ones are offloaded to a thread
+    raw_bios = {}
     for ad in author_details_list:
         if not ad: continue
         k = ad.get("key")
         b = ad.get("bio")
         if isinstance(b, dict): b = b.get("value") 
-        if k and b: author_bio_map[k] = clean_html_text(b)
+        if k and b: raw_bios[k] = b
+    cleaned_bios = await asyncio.gather(*(clean_html_text_async(b) for b in raw_bios.values()))
+    author_bio_map = dict(zip(raw_bios, cleaned_bios))
 
+    ol_authors_list = open_library_book.get("authors", [])
     final_authors = []
     if ol_authors_list: 
         for a in ol_authors_list:
@@ -978,24 +1327,27 @@ async def get_book_by_isbn(request: Request, isbn: str = Depends(validate_and_cl
             if "url" in a: key = a["url"].split("/")[-1]
             elif "key" in a: key = a["key"]
             bio = author_bio_map.get(key) if key else None
-            final_authors.append(AuthorItem(name=name, key=key, bio=bio))
+            final_authors.append(AuthorItem.model_construct(name=name, key=key, bio=bio))
             
     if not final_authors:
-        final_authors = [AuthorItem(name=a, key=None) for a in g_info.get("authors", [])]
+        final_authors = [AuthorItem.model_construct(name=a, key=None, bio=None) for a in g_info.get("authors", [])]
     
     # If authors still empty, try LOC
     if not final_authors and loc_data.get("authors"):
         for a in loc_data.get("authors", []):
-             final_authors.append(AuthorItem(name=a.get("name", "Unknown")))
+             final_authors.append(AuthorItem.model_construct(name=a.get("name", "Unknown"), key=None, bio=None))
 
     # Initialize variables to avoid scope errors
     isbn_10 = None
     related_isbns = []
     
-    if g_info.get("industryIdentifiers"):
-        isbn_10 = next((i["identifier"] for i in g_info.get("industryIdentifiers", []) if i["type"] == "ISBN_10"), None)
-        related_isbns = [i["identifier"] for i in g_info.get("industryIdentifiers", [])]
-        
+    # Single pass over the identifiers: collect related ISBNs and pick the first ISBN_10
+    for i in g_info.get("industryIdentifiers") or []:
+        ident = i.get("identifier")
+        if not ident: continue
+        related_isbns.append(ident)
+        if isbn_10 is None and i.get("type") == "ISBN_10": isbn_10 = ident
+
     is_ebook = google_volume.get("saleInfo", {}).get("isEbook", False)
     # REGRESSION FIX: Correctly call classify_format with both arguments
     fmt = classify_format(g_info.get("pageCount"), is_ebook) 
@@ -1003,57 +1355,52 @@ async def get_book_by_isbn(request: Request, isbn: str = Depends(validate_and_cl
     content_flag = check_content_safety(description, combined_subjects)
     series = detect_series(g_info.get("title", ""), g_info.get("subtitle"))
 
+    # Built locally and already https, so no ensure_https pass (that is for upstream Google links)
     ol_covers = OpenLibraryCoverLinks(
-        small=ensure_https(f"https://covers.openlibrary.org/b/isbn/{isbn}-S.jpg"),
-        medium=ensure_https(f"https://covers.openlibrary.org/b/isbn/{isbn}-M.jpg"),
-        large=ensure_https(f"https://covers.openlibrary.org/b/isbn/{isbn}-L.jpg")
-    )
-    
-    links = g_info.get("imageLinks", {})
-    raw_thumbnail = ensure_https(links.get("thumbnail"))
-    extra_large = ensure_https(links.get("extraLarge"))
-    if not extra_large and raw_thumbnail: extra_large = generate_high_res_url(raw_thumbnail)
-    large = ensure_https(links.get("large"))
-    if not large and raw_thumbnail: large = generate_high_res_url(raw_thumbnail)
-
-    g_covers = GoogleCoverLinks(
-        thumbnail=raw_thumbnail,
-        smallThumbnail=ensure_https(links.get("smallThumbnail")),
-        small=ensure_https(links.get("small")),
-        medium=ensure_https(links.get("medium")),
-        large=large,
-        extraLarge=extra_large
+        small=f"https://covers.openlibrary.org/b/isbn/{isbn}-S.jpg",
+        medium=f"https://covers.openlibrary.org/b/isbn/{isbn}-M.jpg",
+        large=f"https://covers.openlibrary.org/b/isbn/{isbn}-L.jpg"
     )
     
-    cover_url = g_covers.thumbnail or g_covers.smallThumbnail or g_covers.small or g_covers.medium
-    if not cover_url:
-        # Use the passed ID for cover lookup fallback
-        if isbn: cover_url = f"https://covers.openlibrary.org/b/isbn/{isbn}-M.jpg"
+    g_covers = _build_google_covers(g_info.get("imageLinks", {}))
 
     sources = []
     if google_volume: sources.append("Google Books")
     if open_library_book: sources.append("Open Library")
     if loc_data: sources.append("Library of Congress")
 
-    # FIX: Correct instantiation of MergedBook (Robust Variable Scope)
-    merged_book = MergedBook(
-        title=g_info.get("title", open_library_book.get("title", "Title Not Found")),
-        subtitle=g_info.get("subtitle"),
+    # Every field below was built by us from trusted upstream parsing, so skip validation here.
+    # Raw upstream sub-objects are still validated into their models, and the route's
+    # response_model re-validates the whole book (LoC merge included) at the FastAPI boundary,
+    # which is why /book returns the model itself rather than pre-serialized JSON.
+    dimensions = g_info.get("dimensions")
+    sale_info = google_volume.get("saleInfo")
+    access_info = google_volume.get("accessInfo")
+
+    # Bind the bound .get methods once; the constructor below reads both payloads repeatedly
+    g_get = g_info.get
+    ol_get = open_library_book.get
+    # OL can send "publishers": [] (or null), which the old [0] dereference turned into an IndexError
+    ol_publishers = ol_get("publishers") or ({},)
+
+    merged_book = MergedBook.model_construct(
+        title=g_get("title", ol_get("title", "Title Not Found")),
+        subtitle=g_get("subtitle"),
         authors=final_authors,
         isbn_13=isbn, # Use the requested ID as the primary key
         isbn_10=isbn_10,
         google_book_id=google_volume.get("id"),
         description=description,
-        publisher=g_info.get("publisher", open_library_book.get("publishers", [{}])[0].get("name")),
-        published_date=g_info.get("publishedDate", open_library_book.get("publish_date")),
-        page_count=g_info.get("pageCount", open_library_book.get("number_of_pages")),
-        average_rating=g_info.get("averageRating"),
-        ratings_count=g_info.get("ratingsCount"),
-        dimensions=g_info.get("dimensions"),
-        sale_info=google_volume.get("saleInfo"),
-        access_info=google_volume.get("accessInfo"),
+        publisher=g_get("publisher", ol_publishers[0].get("name")),
+        published_date=g_get("publishedDate", ol_get("publish_date")),
+        page_count=g_get("pageCount", ol_get("number_of_pages")),
+        average_rating=g_get("averageRating"),
+        ratings_count=g_get("ratingsCount"),
+        dimensions=Dimensions.model_validate(dimensions) if dimensions else None,
+        sale_info=SaleInfo.model_validate(sale_info) if sale_info else None,
+        access_info=AccessInfo.model_validate(access_info) if access_info else None,
         google_cover_links=g_covers,
-        open_library_id=open_library_book.get("key"),
+        open_library_id=ol_get("key"),
         subjects=combined_subjects,
         open_library_cover_links=ol_covers,
         series=series,
@@ -1070,13 +1417,17 @@ async def get_book_by_isbn(request: Request, isbn: str = Depends(validate_and_cl
 # --- NEW: Helper to identify LCCN queries ---
 def _is_lccn(q: str) -> bool:
     clean = q.replace("-", "").strip()
-    return clean.isdigit() and 8 <= len(clean) <= 12
+    # isascii() is O(1) in CPython and rejects non-ASCII digits before the isdigit() scan
+    return 8 <= len(clean) <= 12 and clean.isascii() and clean.isdigit()
 
 @app.get("/search", response_model=HybridSearchResponse, tags=["Books"])
 # --- SECURITY UPGRADE: Tiered Rate Limits (Heavy) ---
 @limiter.limit("20/minute")
 async def search_hybrid(request: Request, q: str, subject: Optional[str] = None, limit: int = 10, start_index: int = 0):
-    
+    _, response_key = _cache_key("/search", {"q": q, "subject": subject, "limit": limit, "start_index": start_index})
+    cached_response = await get_cached_response(response_key)
+    if cached_response: return cached_response
+
     # 1. Determine Search Mode based on Input Type
     is_id_search = _is_lccn(q)
     
@@ -1086,21 +1437,9 @@ async def search_hybrid(request: Request, q: str, subject: Optional[str] = None,
 
     if is_id_search:
         logger.info(f"Detected LCCN-like query: {q}. Switching to ID search mode.")
-        google_task = asyncio.sleep(0, result=[]) # Skip Google for ID search
-        ol_task = asyncio.sleep(0, result=[]) # Skip OL for ID search
-        
-        # Use Item Lookup (get_loc_data_by_lccn) but wrap it in a task that returns a list
-        # We need an async wrapper because get_loc_data_by_lccn returns Dict, not List[Dict]
-        async def loc_id_wrapper(lccn_id):
-            res = await loc.get_loc_data_by_lccn(lccn_id)
-            return [res] if res else []
-            
-        loc_task = loc_id_wrapper(q)
-        
-        # Parallel Execution (Simulated for single task, but consistent structure)
-        google_results, ol_results, loc_results = await asyncio.gather(
-            google_task, ol_task, loc_task
-        )
+        # Skip Google + OL for ID search; only the LOC Item lookup applies
+        google_results, ol_results = [], []
+        loc_results = wrap_in_list(await loc.get_loc_data_by_lccn(q))
         
     else:
         # Phase 1: Literalist Query Injection (The Fix for 'Girl, Incorrupted')
@@ -1139,110 +1478,196 @@ async def search_hybrid(request: Request, q: str, subject: Optional[str] = None,
     
     # 3. Merge (Pass query for Title Boosting)
     final_results = _merge_and_deduplicate_results(google_results, ol_results, loc_results, query=q)
-    return HybridSearchResponse(query=q, subject=subject, num_found=len(final_results), results=final_results)
+    # Empty results are usually an upstream hiccup, so don't pin them for an hour
+    response = HybridSearchResponse(query=q, subject=subject, num_found=len(final_results), results=final_results)
+    return await cache_model_response(response_key, response, store=bool(final_results))
 
 # --- QUALITY GATE HELPER ---
+REPRINT_TRIGGER_RE = re.compile("anniversary edition|classic|reissue|reprint")
+YEAR_RE = re.compile(r"(\d{4})")
+FULL_DATE_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})")
+
+# (current year, oldest allowed date, newest allowed date), refreshed once a minute rather
+# than calling datetime.now() for every candidate book
+RELEASE_CUTOFFS_TTL = 60.0
+_release_cutoffs_cache: tuple = (0.0, None)
+
+def _release_cutoffs() -> tuple:
+    global _release_cutoffs_cache
+    expires_at, cutoffs = _release_cutoffs_cache
+    if cutoffs is not None and time.monotonic() < expires_at: return cutoffs
+    now = datetime.now()
+    # FIX: Tightened window to 7 days
+    cutoffs = (now.year, now - timedelta(days=365), now + timedelta(days=7)) # Was 90
+    _release_cutoffs_cache = (time.monotonic() + RELEASE_CUTOFFS_TTL, cutoffs)
+    return cutoffs
+
 def _is_valid_release(book: SearchResultItem) -> bool:
     if not book.cover_url: return False
+    return _is_valid_release_precover(book)
+
+# Every release check except the cover. /new-releases runs this before the cover rescue
+# so books that would be rejected anyway never cost a Google lookup.
+def _is_valid_release_precover(book: SearchResultItem) -> bool:
     if not book.isbn_13 and not book.isbn_10: return False
     if not book.authors or book.authors[0].name == "Unknown": return False
-    lower_title = book.title.lower()
-    if "<" in lower_title or "{" in lower_title or len(lower_title) > 150: return False
-    if any(banned in lower_title for banned in TITLE_BLACKLIST): return False
-    reprint_triggers = ["anniversary edition", "classic", "reissue", "reprint"]
-    if any(trigger in lower_title for trigger in reprint_triggers): return False
+    title = book.title
+    # Markup and length checks don't depend on case; reject on them before building the lowered copy
+    if "<" in title or "{" in title or len(title) > 150: return False
+    lower_title = title.lower()
+    if _is_blacklisted(lower_title): return False
+    if REPRINT_TRIGGER_RE.search(lower_title): return False
     if not book.published_date: return False
     
     # --- DATE VALIDATION LOGIC (Ghost Book Fix) ---
-    try:
-        now = datetime.now()
-        # FIX: Tightened window to 7 days
-        cutoff_past = now - timedelta(days=365)
-        cutoff_future = now + timedelta(days=7) # Was 90
-
-        # 1. Parse Year first (fast fail)
-        match = re.search(r"(\d{4})", book.published_date)
-        if not match: return False
-        year = int(match.group(1))
-
-        # Basic Year Checks
-        if year < (now.year - 1): return False # Too Old
-        
-        # FIX: Hard stop on future years (e.g. 2026 when it is 2025)
-        if year > (now.year + 1): return False 
+    current_year, cutoff_past, cutoff_future = _release_cutoffs()
 
-        # 2. Strict Date Parsing (if possible)
-        # Try YYYY-MM-DD
-        try:
-            pub_dt = datetime.strptime(book.published_date[:10], "%Y-%m-%d")
-            if pub_dt < cutoff_past or pub_dt > cutoff_future:
-                return False
-        except ValueError:
-            # Fallback: If it's just a year (2025), and we are in 2025, it passes.
-            # If it is 2026, and we are in Dec 2025, it might be valid.
-            # But if it is 2026 and we are in 2025, block it.
-            if year > now.year:
-                 return False
-            pass
+    # 1. Parse Year first (fast fail)
+    match = YEAR_RE.search(book.published_date)
+    if not match: return False
+    year = int(match.group(1))
+
+    # Basic Year Checks
+    if year < (current_year - 1): return False # Too Old
+    
+    # FIX: Hard stop on future years (e.g. 2026 when it is 2025)
+    if year > (current_year + 1): return False 
+
+    # 2. Strict Date Parsing (if possible)
+    # Try YYYY-MM-DD (same inputs strptime("%Y-%m-%d") accepted, checked explicitly)
+    full_date = FULL_DATE_RE.fullmatch(book.published_date[:10])
+    if full_date:
+        y, m, d = int(full_date[1]), int(full_date[2]), int(full_date[3])
+        if 1 <= m <= 12 and 1 <= d <= monthrange(y, m)[1]:
+            return cutoff_past <= datetime(y, m, d) <= cutoff_future
+
+    # Fallback: If it's just a year (2025), and we are in 2025, it passes.
+    # If it is 2026, and we are in Dec 2025, it might be valid.
+    # But if it is 2026 and we are in 2025, block it.
+    return year <= current_year
+
+# ISBN -> (expires_at, cover URL or None). Overlapping /new-releases pages and subjects
+# keep rescuing the same ISBNs; remembering just the outcome skips the cache round-trip
+# and the decode of a full Google volume. Only answers Google actually gave are stored
+# (a found volume with or without a cover), never a failed/empty lookup.
+RESCUE_MEMO_TTL = 3600.0
+RESCUE_MEMO_MAX_ENTRIES = 10_000
+_rescue_memo: Dict[str, tuple] = {}
+
+async def _rescue_cover(book: SearchResultItem) -> None:
+    isbn = book.isbn_13 or book.isbn_10
+    memo = _rescue_memo.get(isbn)
+    if memo is not None and time.monotonic() < memo[0]:
+        if memo[1]: book.cover_url = memo[1]
+        return
 
+    try:
+        g_data = await get_google_data_by_isbn(isbn)
     except Exception:
-        return False
+        return
+    if not g_data: return
 
-    return True
+    g_images = g_data.get("volumeInfo", {}).get("imageLinks", {})
+    rescued_cover = ensure_https(g_images.get("thumbnail") or g_images.get("smallThumbnail"))
+    if len(_rescue_memo) >= RESCUE_MEMO_MAX_ENTRIES:
+        _rescue_memo.pop(next(iter(_rescue_memo)), None)
+    _rescue_memo[isbn] = (time.monotonic() + RESCUE_MEMO_TTL, rescued_cover)
+    if rescued_cover:
+        book.cover_url = rescued_cover
 
 # --- THE DEEP DREDGE ENDPOINT ---
 @app.get("/new-releases", response_model=NewReleasesResponse, tags=["Books"])
 # --- SECURITY UPGRADE: Tiered Rate Limits (Heavy) ---
 @limiter.limit("15/minute")
 async def get_new_releases(request: Request, subject: Optional[str] = None, limit: int = 10, start_index: int = 0):
+    _, response_key = _cache_key("/new-releases", {"subject": subject, "limit": limit, "start_index": start_index})
+    cached_response = await get_cached_response(response_key)
+    if cached_response: return cached_response
+
     valid_books = []
+    seen_keys = set()
     current_offset = start_index
     depth = 0
     MAX_DEPTH = 5
     INTERNAL_BATCH_SIZE = 40 
-    
-    while len(valid_books) < limit and depth < MAX_DEPTH:
-        # Fetch from BOTH sources
-        google_task = get_google_new_releases(limit=INTERNAL_BATCH_SIZE, start_index=current_offset, subject=subject)
-        ol_task = get_open_library_new_releases(limit=INTERNAL_BATCH_SIZE, offset=current_offset, subject=subject)
-        
-        g_results, ol_results = await asyncio.gather(google_task, ol_task)
-        
-        # Combine (Google first as quality is often better)
-        batch_results = g_results + ol_results
-        
-        if not batch_results:
-            break
-            
-        for book in batch_results:
-            if not book.cover_url:
-                isbn = book.isbn_13 or book.isbn_10
-                if isbn:
-                    try:
-                        g_data = await get_google_data_by_isbn(isbn)
-                        g_images = g_data.get("volumeInfo", {}).get("imageLinks", {})
-                        rescued_cover = g_images.get("thumbnail") or g_images.get("smallThumbnail")
-                        if rescued_cover:
-                            book.cover_url = ensure_https(rescued_cover)
-                    except Exception as e:
-                        pass
+
+    def fetch_page(batch_size: int, offset: int):
+        # gather schedules both provider calls immediately, so the returned future can be
+        # held as a prefetch and awaited later
+        return asyncio.gather(
+            get_google_new_releases(limit=batch_size, start_index=offset, subject=subject),
+            get_open_library_new_releases(limit=batch_size, offset=offset, subject=subject),
+        )
+
+    prefetched = None
+    try:
+        while len(valid_books) < limit and depth < MAX_DEPTH:
+            if prefetched is not None:
+                batch_size, page = prefetched
+                prefetched = None
+            else:
+                # After the first page, only ask for ~3x what we still need (assumes ~1/3 pass the quality gate)
+                need = limit - len(valid_books)
+                batch_size = INTERNAL_BATCH_SIZE if depth == 0 else min(INTERNAL_BATCH_SIZE, max(need * 3, 10))
+                # Fetch from BOTH sources
+                page = fetch_page(batch_size, current_offset)
+
+            g_results, ol_results = await page
             
-            # Apply the new Strict Validator here
-            if _is_valid_release(book):
+            if not g_results and not ol_results:
+                break
+
+            # Combine (Google first as quality is often better), dropping duplicates across
+            # sources and depths and books failing the non-cover release checks BEFORE the
+            # rescue, so we never pay for a book we'd discard. seen_keys only holds books already
+            # accepted (cover included), so a rejected copy (e.g. a Google item with no authors,
+            # or one whose cover rescue fails) can't shadow a valid copy of the same book.
+            batch_results = []
+            for book in chain(g_results, ol_results):
+                if not _is_valid_release_precover(book): continue
+                if (book.isbn_13 or book.isbn_10 or book.title) in seen_keys: continue
+                batch_results.append(book)
+
+            # If this batch can't fill the page even if every book passed, the next depth is
+            # certain: start fetching it now so it overlaps the cover rescues and validation.
+            # This depth's acceptances aren't known yet, so the prefetch is deliberately sized
+            # from the shortfall BEFORE them: it over-fetches compared with sizing after
+            # validation, and later offsets shift accordingly.
+            next_offset = current_offset + batch_size
+            if depth + 1 < MAX_DEPTH and len(valid_books) + len(batch_results) < limit:
+                next_size = min(INTERNAL_BATCH_SIZE, max((limit - len(valid_books)) * 3, 10))
+                prefetched = (next_size, fetch_page(next_size, next_offset))
+
+            # Rescue missing covers concurrently (upstream calls are bounded by GOOGLE_SEM) instead of one await per book.
+            # Every book left in the batch has an ISBN, since the precover check requires one.
+            rescue_tasks = [_rescue_cover(book) for book in batch_results if not book.cover_url]
+            if rescue_tasks:
+                await asyncio.gather(*rescue_tasks)
+
+            for book in batch_results:
+                # Everything but the cover was already validated above; the first copy of a
+                # book to pass is kept, same-batch duplicates after it are skipped here
+                if not book.cover_url: continue
+                k = book.isbn_13 or book.isbn_10 or book.title
+                if k in seen_keys: continue
+                seen_keys.add(k)
                 valid_books.append(book)
-                
-        current_offset += INTERNAL_BATCH_SIZE
-        depth += 1
+                if len(valid_books) >= limit: break
+                    
+            current_offset = next_offset
+            depth += 1
+    finally:
+        # Only reachable with a pending prefetch if an error cut the loop short. Don't cancel
+        # it (other requests may be single-flight followers of those fetches); just make sure
+        # its outcome is consumed.
+        if prefetched is not None:
+            prefetched[1].add_done_callback(lambda f: f.cancelled() or f.exception())
     
-    unique_books = {}
-    for b in valid_books:
-        k = b.isbn_13 or b.isbn_10 or b.title
-        if k not in unique_books:
-            unique_books[k] = b
-            
-    final_list = list(unique_books.values())[:limit]
+    # The validation loop stops at `limit`, so valid_books is already the final page
+    final_list = valid_books
 
-    return NewReleasesResponse(subject=subject, num_found=len(final_list), results=final_list)
+    response = NewReleasesResponse(subject=subject, num_found=len(final_list), results=final_list)
+    return await cache_model_response(response_key, response, store=bool(final_list))
 
 def _mine_bio_from_books(author_name: str, books: List[SearchResultItem]) -> Optional[str]:
     name_parts = author_name.split()
@@ -1304,13 +1729,16 @@ def _generate_dynamic_bio(name: str, books: List[SearchResultItem]) -> str:
 @limiter.limit("20/minute")
 async def get_author_profile(request: Request, id: str):
     if id.startswith("OL") and id.endswith("A"):
-        try:
-            author_data = await get_open_library_author(id)
-            if not author_data:
-                raise HTTPException(status_code=404, detail="Author not found.")
-        except Exception:
+        # Profile and works are independent lookups; overlap the two round-trips
+        author_data, works_results = await asyncio.gather(
+            get_open_library_author(id),
+            search_open_library(q=f"author_key:{id}", limit=20, offset=0),
+            return_exceptions=True,
+        )
+        if isinstance(author_data, BaseException) or not author_data:
             raise HTTPException(status_code=404, detail="Author not found.")
-        works_results = await search_open_library(q=f"author_key:{id}", limit=20, offset=0)
+        if isinstance(works_results, BaseException):
+            raise works_results
         photo_url = None
         if "photos" in author_data and author_data["photos"]:
              photo_id = author_data["photos"][0]
@@ -1326,7 +1754,7 @@ async def get_author_profile(request: Request, id: str):
         return AuthorPageData(
             key=id,
             name=author_data.get("name", "Unknown Author"),
-            bio=clean_html_text(bio_text),
+            bio=await clean_html_text_async(bio_text),
             birth_date=author_data.get("birth_date"),
             death_date=author_data.get("death_date"),
             photo_url=photo_url,
@@ -1379,10 +1807,26 @@ async def get_work_editions(request: Request, work_key: str):
     if not (work_key.startswith("OL") and work_key.endswith("W")): raise HTTPException(status_code=400, detail="Invalid work key.")
     editions_data = await get_open_library_work_editions(work_key)
     if not editions_data: raise HTTPException(status_code=404, detail="Work not found.")
-    editions_data["key"] = f"/works/{work_key}"
-    editions_data["size"] = editions_data.get("size", len(editions_data.get("entries", [])))
-    for entry in editions_data.get("entries", []):
-        if not entry.get("isbn_13") and not entry.get("isbn_10"):
-            entry["isbn_13"] = entry.get("identifiers", {}).get("isbn_13", [])
-            entry["isbn_10"] = entry.get("identifiers", {}).get("isbn_10", [])
-    return WorkEditionsResponse(**editions_data)
\ No newline at end of file
+    # Shape the editions once with model_construct (the response_model still validates the
+    # output) and leave the cached upstream dict untouched
+    raw_entries = editions_data.get("entries", [])
+    entries = []
+    for entry in raw_entries:
+        e_get = entry.get
+        isbn_13, isbn_10 = e_get("isbn_13"), e_get("isbn_10")
+        # Only editions without top-level ISBNs fall back to the identifiers block
+        if not isbn_13 and not isbn_10:
+            identifiers = e_get("identifiers") or {}
+            isbn_13, isbn_10 = identifiers.get("isbn_13"), identifiers.get("isbn_10")
+        entries.append(WorkEdition.model_construct(
+            key=e_get("key"),
+            title=e_get("title"),
+            publish_date=e_get("publish_date"),
+            isbn_13=isbn_13 or [],
+            isbn_10=isbn_10 or []
+        ))
+    return WorkEditionsResponse.model_construct(
+        key=f"/works/{work_key}",
+        size=editions_data.get("size", len(raw_entries)),
+        entries=entries
+    )
\ No newline at end of file
@@ -1,11 +1,41 @@
-from pydantic import BaseModel
-from typing import List, Optional
+import sys
+from dataclasses import dataclass
+from enum import StrEnum
+from functools import cache
+from typing import Optional, Tuple
 
 # --------------------------------------------------------------------
-# 1. Pydantic Models (Same as fiction.py)
+# 1. Taxonomy Models
 # --------------------------------------------------------------------
+# These are hard-coded constants, so plain frozen dataclasses are enough:
+# no validator runs at import and slots drop the per-instance __dict__.
+# FastAPI still serializes them through response_model=List[Genre].
 
-class Subgenre(BaseModel):
+_I = sys.intern
+
+# Canonical tag tuples: equal themes lists across subgenres share one tuple.
+_TUPLES: dict = {}
+
+def _t(values) -> Optional[Tuple[str, ...]]:
+    if not values:
+        return None
+    key = tuple(map(_I, values))
+    return _TUPLES.setdefault(key, key)
+
+_SCALAR_TAGS = ("setting", "time_period", "subject", "tone", "format")
+
+class Umbrella(StrEnum):
+    """
+    Closed vocabulary for Genre.umbrella. Members are str subclasses, so
+    they compare equal to the plain labels and serialize unchanged.
+    """
+    BIOGRAPHY = "Biography & Memoir"
+    INFORMATIONAL = "Informational/Academic"
+    PRACTICAL = "Practical/Instructional"
+    NARRATIVE = "Narrative/Creative"
+
+@dataclass(slots=True, frozen=True)
+class Subgenre:
     """
     Defines a specific subgenre with its corresponding
     project-specific filter tags.
@@ -14,237 +44,210 @@ class Subgenre(BaseModel):
     description: str
     # These fields map to your project filters
     setting: Optional[str] = None
-    themes: Optional[List[str]] = None
+    themes: Optional[Tuple[str, ...]] = None
     time_period: Optional[str] = None
     subject: Optional[str] = None
     tone: Optional[str] = None
     format: Optional[str] = None
 
-class Genre(BaseModel):
+    def __post_init__(self):
+        object.__setattr__(self, "themes", _t(self.themes))
+        for field in _SCALAR_TAGS:
+            value = getattr(self, field)
+            if value is not None:
+                object.__setattr__(self, field, _I(value))
+
+@dataclass(slots=True, frozen=True)
+class Genre:
     """
     Defines a top-level "Umbrella" Genre, which contains
     a list of its subgenres.
     """
-    umbrella: str  # e.g., "Biography & Memoir", "Informational/Academic"
+    umbrella: Umbrella  # e.g., Umbrella.BIOGRAPHY, Umbrella.INFORMATIONAL
     name: str  # e.g., "History", "Science and Nature"
     description: str
-    subgenres: List[Subgenre]
+    subgenres: Tuple[Subgenre, ...]
+
+    def __post_init__(self):
+        object.__setattr__(self, "umbrella", Umbrella(self.umbrella))
+        if not isinstance(self.subgenres, tuple):
+            object.__setattr__(self, "subgenres", tuple(self.subgenres))
+
+# --------------------------------------------------------------------
+# 2. Raw Taxonomy Data
+# --------------------------------------------------------------------
+# Plain literals only: importing this module does no model construction.
+# get_non_fiction_genres() turns _RAW into Genre/Subgenre objects on first use.
+# Subgenre rows are positional, in Subgenre field order:
+# (name, description, setting, themes, time_period, subject, tone, format).
+
+_RAW = {
+    "Biography & Memoir": {
+        "umbrella": Umbrella.BIOGRAPHY,
+        "description": "The life story of a real person (or group).",
+        "subgenres": (
+            ("Autobiography", "Written by the subject themselves, focusing on their entire life.", None, None, "Full Life", "Author", None, None),
+            ("Memoir", "Written by the subject, focusing on a specific theme, period, or aspect of their life.", None, ("Specific Life Event",), None, "Author", None, None),
+            ("Biography", "Written by someone other than the subject.", None, None, None, "Other Person", None, None),
+            ("Collective Biography", "Focuses on the lives of a group of people.", None, None, None, "Group of People", None, None),
+        ),
+    },
+    "History": {
+        "umbrella": Umbrella.INFORMATIONAL,
+        "description": "Focuses on past events, timelines, and analysis.",
+        "subgenres": (
+            ("Military History", "Focuses on conflicts, battles, and military strategy.", None, ("War/Conflict",), "Historical", None, None, None),
+            ("Social History", "Focuses on the lives of everyday people, culture, and societal trends.", None, ("Culture/Society",), None, None, None, None),
+            ("Political History", "Focuses on governments, leaders, policies, and political movements.", None, ("Politics/Government",), None, None, None, None),
+            ("Archaeology", "Focuses on the study of human history and prehistory through excavation and analysis.", None, ("Ancient History",), None, None, None, None),
+        ),
+    },
+    "Science and Nature": {
+        "umbrella": Umbrella.INFORMATIONAL,
+        "description": "Focuses on the natural world, scientific discovery, and technology.",
+        "subgenres": (
+            ("Popular Science", "Explains complex scientific ideas to a general audience.", None, ("General Audience",), None, None, None, None),
+            ("Natural History", "Focuses on the observation of organisms and ecosystems.", "Rural/Nature", None, None, None, None, None),
+            ("Physics/Astronomy", "Focuses on the physical universe, from subatomic particles to galaxies.", None, ("Theoretical Concepts",), None, None, None, None),
+            ("Technology & Computing", "Focuses on practical and theoretical aspects of modern tech and coding.", None, ("Technical Skill",), None, None, None, None),
+        ),
+    },
+    "Self-Help": {
+        "umbrella": Umbrella.INFORMATIONAL,
+        "description": "Intended to instruct readers on how to solve personal problems or improve their lives.",
+        "subgenres": (
+            ("Productivity/Business", "Focuses on improving efficiency, management, and financial success.", None, ("Career/Finance",), None, None, None, None),
+            ("Mental Health/Wellness", "Focuses on improving psychological well-being, mindfulness, and habits.", None, ("Mental Health",), None, None, None, None),
+            ("Motivational", "Focuses on inspirational stories or philosophies to encourage action.", None, None, None, None, "Inspirational", None),
+            ("Relationship Advice", "Focuses on guidance for dating, marriage, or family dynamics.", None, ("Relationships",), None, None, None, None),
+        ),
+    },
+    "Instructional / How-To": {
+        "umbrella": Umbrella.PRACTICAL,
+        "description": "Guiding the reader through a specific activity or skill.",
+        "subgenres": (
+            ("Cookbooks", "Provides recipes and techniques related to food preparation.", None, ("Cuisine/Diet",), None, None, None, None),
+            ("DIY/Crafts", "Provides instructions for creating objects, home repair, or specialized crafts.", None, ("Home Improvement",), None, None, None, None),
+            ("Fitness/Exercise", "Focuses on workout routines, training, and physical health.", None, ("Physical Fitness",), None, None, None, None),
+            ("Travel Guides", "Provides destination-specific information.", "Specific Location", None, None, None, None, None),
+        ),
+    },
+    "Journalism & True Crime": {
+        "umbrella": Umbrella.NARRATIVE,
+        "description": "Using fictional techniques (storytelling) to convey factual events.",
+        "subgenres": (
+            ("Investigative Journalism", "Deep research and analysis into a specific issue or controversy.", None, ("Current Events/Politics",), None, None, None, None),
+            ("Creative Non-Fiction", "Uses literary styles (like dialogue and stream-of-consciousness) to report facts.", None, None, None, None, "Literary", None),
+            ("True Crime", "Detailed accounts of real crimes, focusing on the investigation and legal process.", None, ("Crime/Legal",), None, None, None, None),
+            ("Essays", "Short pieces of writing that explore a subject or argue a specific point of view.", None, None, None, None, None, "Collection of Short Pieces"),
+        ),
+    },
+    "Religious & Philosophical": {
+        "umbrella": Umbrella.INFORMATIONAL,
+        "description": "Focuses on beliefs, existential questions, and spiritual practices.",
+        "subgenres": (
+            ("Theology", "The study of the nature of God and religious belief.", None, ("Religious Doctrine",), None, None, None, None),
+            ("Philosophy", "Exploration of fundamental truths about existence, knowledge, and values.", None, ("Abstract Thought",), None, None, None, None),
+            ("Comparative Religion", "Analyzes the similarities and differences between world religions.", None, ("Multiple Belief Systems",), None, None, None, None),
+        ),
+    },
+}
+
+# Legacy per-genre list names, resolved lazily by __getattr__.
+_SUBGENRE_LISTS = {
+    "biography_subgenres": "Biography & Memoir",
+    "history_subgenres": "History",
+    "science_subgenres": "Science and Nature",
+    "self_help_subgenres": "Self-Help",
+    "instructional_subgenres": "Instructional / How-To",
+    "journalism_subgenres": "Journalism & True Crime",
+    "philosophy_subgenres": "Religious & Philosophical",
+}
+
+@cache
+def get_non_fiction_genres() -> Tuple[Genre, ...]:
+    """
+    Builds the non-fiction taxonomy on first use and memoizes it, so
+    processes that never serve /genres/non-fiction skip the construction.
+    """
+    return tuple(
+        Genre(
+            umbrella=raw["umbrella"],
+            name=name,
+            description=raw["description"],
+            subgenres=tuple(Subgenre(*row) for row in raw["subgenres"]),
+        )
+        for name, raw in _RAW.items()
+    )
 
 # --------------------------------------------------------------------
-# 2. Subgenre Definitions
+# 3. Column Views (Struct-of-Arrays)
 # --------------------------------------------------------------------
+# Filter passes usually read one tag field across every subgenre, so keep
+# each field as its own flat tuple. Row i of every column is SUBGENRES[i];
+# genre j owns rows GENRE_OFFSETS[j]:GENRE_OFFSETS[j + 1].
+
+_SOA_COLUMNS = {
+    "SUBGENRE_NAMES": "name",
+    "SUBGENRE_SETTINGS": "setting",
+    "SUBGENRE_THEMES": "themes",
+    "SUBGENRE_TIME_PERIODS": "time_period",
+    "SUBGENRE_SUBJECTS": "subject",
+    "SUBGENRE_TONES": "tone",
+    "SUBGENRE_FORMATS": "format",
+}
 
-# --- 1. BIOGRAPHY AND MEMOIR ---
-biography_subgenres = [
-    Subgenre(
-        name="Autobiography",
-        description="Written by the subject themselves, focusing on their entire life.",
-        subject="Author",
-        time_period="Full Life"
-    ),
-    Subgenre(
-        name="Memoir",
-        description="Written by the subject, focusing on a specific theme, period, or aspect of their life.",
-        subject="Author",
-        themes=["Specific Life Event"]
-    ),
-    Subgenre(
-        name="Biography",
-        description="Written by someone other than the subject.",
-        subject="Other Person"
-    ),
-    Subgenre(
-        name="Collective Biography",
-        description="Focuses on the lives of a group of people.",
-        subject="Group of People"
-    ),
-]
-
-# --- 2. HISTORY ---
-history_subgenres = [
-    Subgenre(
-        name="Military History",
-        description="Focuses on conflicts, battles, and military strategy.",
-        time_period="Historical",
-        themes=["War/Conflict"]
-    ),
-    Subgenre(
-        name="Social History",
-        description="Focuses on the lives of everyday people, culture, and societal trends.",
-        themes=["Culture/Society"]
-    ),
-    Subgenre(
-        name="Political History",
-        description="Focuses on governments, leaders, policies, and political movements.",
-        themes=["Politics/Government"]
-    ),
-    Subgenre(
-        name="Archaeology",
-        description="Focuses on the study of human history and prehistory through excavation and analysis.",
-        themes=["Ancient History"]
-    ),
-]
-
-# --- 3. SCIENCE AND NATURE ---
-science_subgenres = [
-    Subgenre(
-        name="Popular Science",
-        description="Explains complex scientific ideas to a general audience.",
-        themes=["General Audience"]
-    ),
-    Subgenre(
-        name="Natural History",
-        description="Focuses on the observation of organisms and ecosystems.",
-        setting="Rural/Nature"
-    ),
-    Subgenre(
-        name="Physics/Astronomy",
-        description="Focuses on the physical universe, from subatomic particles to galaxies.",
-        themes=["Theoretical Concepts"]
-    ),
-    Subgenre(
-        name="Technology & Computing",
-        description="Focuses on practical and theoretical aspects of modern tech and coding.",
-        themes=["Technical Skill"]
-    ),
-]
-
-# --- 4. SELF-HELP AND PERSONAL DEVELOPMENT ---
-self_help_subgenres = [
-    Subgenre(
-        name="Productivity/Business",
-        description="Focuses on improving efficiency, management, and financial success.",
-        themes=["Career/Finance"]
-    ),
-    Subgenre(
-        name="Mental Health/Wellness",
-        description="Focuses on improving psychological well-being, mindfulness, and habits.",
-        themes=["Mental Health"]
-    ),
-    Subgenre(
-        name="Motivational",
-        description="Focuses on inspirational stories or philosophies to encourage action.",
-        tone="Inspirational"
-    ),
-    Subgenre(
-        name="Relationship Advice",
-        description="Focuses on guidance for dating, marriage, or family dynamics.",
-        themes=["Relationships"]
-    ),
-]
-
-# --- 5. INSTRUCTIONAL / HOW-TO ---
-instructional_subgenres = [
-    Subgenre(
-        name="Cookbooks",
-        description="Provides recipes and techniques related to food preparation.",
-        themes=["Cuisine/Diet"]
-    ),
-    Subgenre(
-        name="DIY/Crafts",
-        description="Provides instructions for creating objects, home repair, or specialized crafts.",
-        themes=["Home Improvement"]
-    ),
-    Subgenre(
-        name="Fitness/Exercise",
-        description="Focuses on workout routines, training, and physical health.",
-        themes=["Physical Fitness"]
-    ),
-    Subgenre(
-        name="Travel Guides",
-        description="Provides destination-specific information.",
-        setting="Specific Location"
-    ),
-]
-
-# --- 6. JOURNALISM AND TRUE CRIME ---
-journalism_subgenres = [
-    Subgenre(
-        name="Investigative Journalism",
-        description="Deep research and analysis into a specific issue or controversy.",
-        themes=["Current Events/Politics"]
-    ),
-    Subgenre(
-        name="Creative Non-Fiction",
-        description="Uses literary styles (like dialogue and stream-of-consciousness) to report facts.",
-        tone="Literary"
-    ),
-    Subgenre(
-        name="True Crime",
-        description="Detailed accounts of real crimes, focusing on the investigation and legal process.",
-        themes=["Crime/Legal"]
-    ),
-    Subgenre(
-        name="Essays",
-        description="Short pieces of writing that explore a subject or argue a specific point of view.",
-        format="Collection of Short Pieces"
-    ),
-]
-
-# --- 7. RELIGIOUS AND PHILOSOPHICAL ---
-philosophy_subgenres = [
-    Subgenre(
-        name="Theology",
-        description="The study of the nature of God and religious belief.",
-        themes=["Religious Doctrine"]
-    ),
-    Subgenre(
-        name="Philosophy",
-        description="Exploration of fundamental truths about existence, knowledge, and values.",
-        themes=["Abstract Thought"]
-    ),
-    Subgenre(
-        name="Comparative Religion",
-        description="Analyzes the similarities and differences between world religions.",
-        themes=["Multiple Belief Systems"]
-    ),
-]
+@cache
+def _build_soa() -> dict:
+    genres = get_non_fiction_genres()
+    subgenres = tuple(s for g in genres for s in g.subgenres)
+
+    offsets = [0]
+    for g in genres:
+        offsets.append(offsets[-1] + len(g.subgenres))
+
+    soa = {"SUBGENRES": subgenres, "GENRE_OFFSETS": tuple(offsets)}
+    for column, field in _SOA_COLUMNS.items():
+        soa[column] = tuple(getattr(s, field) for s in subgenres)
+    return soa
 
 # --------------------------------------------------------------------
-# 3. The Final Compiled List
+# 4. Lookup Indexes
 # --------------------------------------------------------------------
 
-NON_FICTION_GENRES: List[Genre] = [
-    Genre(
-        umbrella="Biography & Memoir",
-        name="Biography & Memoir",
-        description="The life story of a real person (or group).",
-        subgenres=biography_subgenres
-    ),
-    Genre(
-        umbrella="Informational/Academic",
-        name="History",
-        description="Focuses on past events, timelines, and analysis.",
-        subgenres=history_subgenres
-    ),
-    Genre(
-        umbrella="Informational/Academic",
-        name="Science and Nature",
-        description="Focuses on the natural world, scientific discovery, and technology.",
-        subgenres=science_subgenres
-    ),
-    Genre(
-        umbrella="Informational/Academic",
-        name="Self-Help",
-        description="Intended to instruct readers on how to solve personal problems or improve their lives.",
-        subgenres=self_help_subgenres
-    ),
-    Genre(
-        umbrella="Practical/Instructional",
-        name="Instructional / How-To",
-        description="Guiding the reader through a specific activity or skill.",
-        subgenres=instructional_subgenres
-    ),
-    Genre(
-        umbrella="Narrative/Creative",
-        name="Journalism & True Crime",
-        description="Using fictional techniques (storytelling) to convey factual events.",
-        subgenres=journalism_subgenres
-    ),
-    Genre(
-        umbrella="Informational/Academic",
-        name="Religious & Philosophical",
-        description="Focuses on beliefs, existential questions, and spiritual practices.",
-        subgenres=philosophy_subgenres
-    ),
-]
\ No newline at end of file
+_INDEX_NAMES = ("SUBGENRE_BY_NAME", "GENRES_BY_UMBRELLA", "THEME_INDEX")
+
+@cache
+def _build_indexes() -> dict:
+    subgenre_by_name = {}
+    genres_by_umbrella = {}
+    theme_index = {}
+    for g in get_non_fiction_genres():
+        genres_by_umbrella.setdefault(g.umbrella, []).append(g)
+        for s in g.subgenres:
+            subgenre_by_name[s.name] = s
+            for theme in s.themes or ():
+                theme_index.setdefault(theme, []).append(s)
+
+    return {
+        "SUBGENRE_BY_NAME": subgenre_by_name,
+        "GENRES_BY_UMBRELLA": {k: tuple(v) for k, v in genres_by_umbrella.items()},
+        "THEME_INDEX": {k: tuple(v) for k, v in theme_index.items()},
+    }
+
+def filter_subgenres_by_theme(theme: str) -> Tuple[Subgenre, ...]:
+    """Returns every subgenre tagged with `theme`."""
+    return _build_indexes()["THEME_INDEX"].get(theme, ())
+
+def __getattr__(name: str):
+    # PEP 562: keep `non_fiction.NON_FICTION_GENRES` working for existing callers.
+    if name == "NON_FICTION_GENRES":
+        return get_non_fiction_genres()
+    if name in _SUBGENRE_LISTS:
+        genre_name = _SUBGENRE_LISTS[name]
+        return next(g.subgenres for g in get_non_fiction_genres() if g.name == genre_name)
+    if name == "SUBGENRES" or name == "GENRE_OFFSETS" or name in _SOA_COLUMNS:
+        return _build_soa()[name]
+    if name in _INDEX_NAMES:
+        return _build_indexes()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")